@@ -2,9 +2,11 @@
 Purpose: Implementation for The Daily BTC Web Application.
 """
 
+import datetime as dt
 from flask import Flask, redirect
 from databasemanager import DataBaseManager
 from dashboardmanager import DashBoardManager
+from leadermanager import LeaderManager
 from apscheduler.schedulers.background import BackgroundScheduler
 
 # Instantiate Application
@@ -14,32 +16,74 @@ app = Flask(__name__)
 def get_home_page():
     return redirect("/home/")
 
-# Instantiate Managers With Latest Data
-database_manager = DataBaseManager()
-database_manager.update_database()
-dashboard_manager = DashBoardManager(app, database_manager.read_database())
-
-# Schedule Background Tasks
+# Schedule Background Tasks: Only The Leader Process Ingests And Builds; Followers Read Its Snapshots
 def update_database_manager():
     database_manager.update_database()
     return None
 
-def update_dashboard_manager():
-    dashboard_manager.update_dash_objects(database_manager.read_database())
+def update_dashboard_manager(insert_counts=None):
+    dashboard_manager.update_dash_objects(insert_counts)
+    return None
+
+def update_source(source_name):
+    try:
+        database_manager.update_database([source_name])
+    finally:
+        schedule_source_update(source_name) # Rescheduled Even After A Failed Poll, Honoring Any Retry-After
     return None
 
-scheduler = BackgroundScheduler(daemon=True)
-scheduler.add_job(
-    func=update_database_manager, 
-    trigger='interval',
-    seconds=database_manager.update_database_rate_sec
-    )
-scheduler.add_job(
-    func=update_dashboard_manager, 
-    trigger='interval',
-    seconds=database_manager.update_database_rate_sec + 60 * 15 # 15-Minute Delays For DataBase Updates
-    )
-scheduler.start()
+def schedule_source_update(source_name):
+    # Each Source Polls On Its Own Cadence, Adapted To Its Data Changes And Remaining Quota
+    scheduler.add_job(
+        func=update_source,
+        args=[source_name],
+        trigger='date',
+        run_date=dt.datetime.now() + dt.timedelta(
+            seconds=database_manager.schedule_manager.get_next_delay_sec(source_name)
+            ),
+        id=f"update-{source_name}",
+        replace_existing=True
+        )
+    return None
+
+def initialize_managers():
+    try:
+        if dashboard_manager.is_snapshot_stale():
+            update_dashboard_manager() # Serve What The DataBase Already Has Before Fetching
+        update_database_manager() # Every Source At Once On Startup
+    finally:
+        for source_name in database_manager.sources:
+            schedule_source_update(source_name)
+    return None
+
+def campaign_for_leader():
+    if not leader_manager.is_leader and leader_manager.try_acquire():
+        scheduler.add_job(
+            func=initialize_managers, 
+            trigger='date',
+            run_date=dt.datetime.now() # Latest Data Right After Taking Over, Without Blocking Requests
+            )
+    return None
+
+# Start Up, Except In The Dashboard's Spawned Refresh Process, Which Re-Runs This Script As __mp_main__
+# When Served By "python app.py"; There It Would Build A Second Set Of Dash Apps And Campaign For The Lock
+if __name__ != "__mp_main__":
+    # Instantiate Managers From The Existing DataBase And Snapshot; Fetching Happens In The Background
+    database_manager = DataBaseManager()
+    dashboard_manager = DashBoardManager(app, database_manager)
+    leader_manager = LeaderManager()
+
+    # Ingest Emits Its Insert Counts; The Dashboard Rebuilds Right Away, Only When Rows Were Inserted
+    database_manager.add_update_listener(update_dashboard_manager)
+
+    scheduler = BackgroundScheduler(daemon=True)
+    scheduler.add_job(
+        func=campaign_for_leader, 
+        trigger='interval',
+        seconds=leader_manager.campaign_rate_sec,
+        next_run_time=dt.datetime.now() # Followers Keep Campaigning To Take Over If The Leader Dies
+        )
+    scheduler.start()
 
 if __name__ == "__main__":
     # Development Server
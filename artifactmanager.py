@@ -0,0 +1,217 @@
+"""
+Purpose: An artifact manager for The Daily BTC Web Application.
+"""
+
+import pandas as pd
+import hashlib
+from databasemanager import DataBaseManager
+from sentimentmanager import SentimentManager
+from snapshotmanager import SnapshotManager
+from newsmanager import NewsManager
+from chartmanager import ChartManager
+
+class ArtifactManager:
+    def __init__(self, database_manager=None):
+        # Calculations
+        self.database_manager = database_manager # Persists Sentiment Results When Provided
+        self.sentiment_manager = SentimentManager()
+        self.snapshot_manager = SnapshotManager()
+        self.chart_manager = ChartManager()
+        self.assets = {} # Asset ID: Newest Status, News, Charts And Dashboard Objects, Kept Across Builds
+        self.updated_asset_ids = [] # Assets Rebuilt By The Latest Build
+        self.news_empty_post = {
+            "source_name": "",
+            "author": "",
+            "title": "",
+            "subtitle": "",
+            "url_to_post": "",
+            "url_to_image": "",
+            "published_date": ""
+            }
+        return None
+
+    def get_asset(self, asset_id):
+        if asset_id not in self.assets:
+            self.assets[asset_id] = {
+                "statuses_df": pd.DataFrame(),
+                "news_manager": NewsManager(),
+                "chart_figures": None,
+                "dash_objects": None
+                }
+        return self.assets[asset_id]
+
+    def read_data_objects(self, incremental):
+        # Articles Past The News Store's Retention Horizon Are Never Read, So Restarts Never Score Them
+        retention_horizon = self.get_asset(self.database_manager.asset_ids[0])["news_manager"].get_retention_horizon(
+            pd.Timestamp.utcnow()
+            )
+        return self.database_manager.read_database_frames(incremental, retention_horizon.strftime("%Y-%m-%d"))
+
+    def get_dash_objects(self, data_objects):
+        now = pd.Timestamp.utcnow() # One Clock Reading Per Build, So Windows Never Overlap Or Gap
+        statuses_df = pd.DataFrame(data_objects['statuses'])
+        news_df = pd.DataFrame(data_objects['news']).dropna()
+
+        # News Calculations: Articles New To Any Asset Are Prepared And Scored Once, In One Batch Across Assets
+        assets_news_dfs = {
+            asset_id: self.get_asset(asset_id)["news_manager"].get_unseen_news(
+                news_df.loc[news_df["asset_id"] == asset_id] if len(news_df) > 0 else news_df,
+                now
+                )
+            for asset_id in data_objects['asset_ids']
+            }
+        unseen_news_dfs_list = [asset_news_df for asset_news_df in assets_news_dfs.values() if len(asset_news_df) > 0]
+        if len(unseen_news_dfs_list) > 0:
+            unseen_news_df = pd.concat(unseen_news_dfs_list, ignore_index=True)
+            scored_news_df = self.get_scored_news(unseen_news_df.drop_duplicates("id").drop(columns=["asset_id", "news_asset_id"]))
+            assets_news_dfs = {
+                asset_id: (
+                    asset_news_df[["id"]].merge(scored_news_df, how="left", on="id")
+                    if len(asset_news_df) > 0
+                    else asset_news_df
+                    )
+                for asset_id, asset_news_df in assets_news_dfs.items()
+                }
+
+        # Per-Asset Dashboard Objects: Rebuilt Only For Assets With New Data, Or When The Day Rolls Over
+        self.updated_asset_ids = []
+        for asset_id in data_objects['asset_ids']:
+            asset = self.get_asset(asset_id)
+            asset_updated = asset["news_manager"].window_top_news_date != now.floor("D")
+
+            # Headline Calculations: Only The Newest Status With Every Headline Field Is Kept
+            temp_statuses_df = (
+                statuses_df.loc[statuses_df["asset_id"] == asset_id].dropna(subset=self.database_manager.headline_columns)
+                if len(statuses_df) > 0
+                else statuses_df
+                )
+            if len(temp_statuses_df) > 0:
+                asset["statuses_df"] = temp_statuses_df.tail(1).reset_index(drop=True)
+                asset_updated = True
+
+            # Economic & Social Charts: One Pre-Aggregated Row Per Day, With Persisted EMAs, Downsampled For Long Histories
+            if data_objects['daily_statuses'][asset_id] is not None: # Not Read When No New Statuses Arrived
+                asset["chart_figures"] = self.chart_manager.get_chart_figures(
+                    self.chart_manager.get_chart_df(data_objects['daily_statuses'][asset_id])
+                    )
+                asset_updated = True
+
+            # News Charts Subsets: Top Article Per Window, Ranked As Articles Arrive
+            asset["news_manager"].add_news(assets_news_dfs[asset_id], now)
+            asset_updated = asset_updated or len(assets_news_dfs[asset_id]) > 0
+            if not asset_updated and asset["dash_objects"] is not None:
+                continue
+            if len(asset["statuses_df"]) == 0 or asset["chart_figures"] is None: # No Headline Status Stored Yet
+                continue
+            asset["dash_objects"] = self.get_asset_dash_objects(asset, now)
+            self.updated_asset_ids.append(asset_id)
+
+        dash_objects = {
+            asset_id: self.assets[asset_id]["dash_objects"]
+            for asset_id in data_objects['asset_ids']
+            if self.assets[asset_id]["dash_objects"] is not None
+            }
+        return dash_objects
+
+    def get_scored_news(self, temp_news_df):
+        temp_news_df = temp_news_df.copy()
+        temp_news_df["published_date"] = pd.to_datetime(temp_news_df["published_date"], utc=True)
+        temp_news_df["subtitle"] = (
+            "By "+ temp_news_df["author"] +
+            " on " + temp_news_df["published_date"].dt.strftime("%b %d, %Y")
+            )
+        temp_news_df["content_preview"] = (
+            "Title: " + temp_news_df["title"] +
+            " Description: " + temp_news_df["description"]
+            )
+        temp_news_df["content_hash"] = [
+            hashlib.sha256(content_preview.encode("utf-8")).hexdigest()
+            for content_preview in temp_news_df["content_preview"]
+            ]
+        temp_news_df = temp_news_df.reset_index(drop=True).merge(
+            self.read_cached_sentiments(temp_news_df["id"].to_list()),
+            how="left",
+            left_on=["id", "content_hash"],
+            right_on=["news_id", "content_hash"]
+            ).drop(columns="news_id")
+
+        # Only Articles Without A Cached Result Go Through The Model
+        uncached_mask = temp_news_df["sentiment_label"].isna()
+        if uncached_mask.any():
+            sentiment_results = pd.DataFrame(
+                self.sentiment_manager.score(temp_news_df.loc[uncached_mask, "content_preview"].to_list())
+                )
+            temp_news_df.loc[uncached_mask, "sentiment_label"] = sentiment_results["sentiment_label"].to_list()
+            temp_news_df.loc[uncached_mask, "sentiment_score"] = sentiment_results["sentiment_score"].to_list()
+            self.write_cached_sentiments(temp_news_df[uncached_mask])
+        return temp_news_df
+
+    def get_asset_dash_objects(self, asset, now):
+        statuses_df = asset["statuses_df"]
+        news_df = asset["news_manager"].news_df
+        window_top_news = asset["news_manager"].get_window_top_news(now)
+
+        # Dashboard Objects
+        dash_objects = {
+            "headline": {
+                "market_cap": statuses_df['market_cap_rank'].iloc[-1],
+                "ath_usd": statuses_df['ath_usd'].iloc[-1],
+                "ath_date": statuses_df['ath_date'].iloc[-1],
+                "atl_usd": statuses_df['atl_usd'].iloc[-1],
+                "atl_date": statuses_df['atl_date'].iloc[-1],
+                "last_updated_timestamp": max(
+                    pd.to_datetime(statuses_df["last_updated_timestamp"], utc=True).max(),
+                    pd.to_datetime(news_df["published_timestamp"], utc=True).max() if len(news_df) > 0 else pd.NaT # Never Wins
+                    )
+                },
+            "economics": asset["chart_figures"]["economics"],
+            "socials": asset["chart_figures"]["socials"],
+            "news": {
+                "today": window_top_news["today"] or self.news_empty_post,
+                "this_week": window_top_news["this_week"] or self.news_empty_post,
+                "this_month": window_top_news["this_month"] or self.news_empty_post
+                }
+            }
+        return dash_objects
+
+    def read_cached_sentiments(self, news_ids_list):
+        if self.database_manager is None:
+            return pd.DataFrame(columns=["news_id", "content_hash", "sentiment_label", "sentiment_score"])
+        return self.database_manager.read_sentiments(news_ids_list, self.sentiment_manager.model_name)
+
+    def write_cached_sentiments(self, scored_news_df):
+        if self.database_manager is None:
+            return None
+        sentiments_rows_list = [
+            {
+                "news_id": int(row["id"]),
+                "content_hash": row["content_hash"],
+                "model_name": self.sentiment_manager.model_name,
+                "model_version": self.sentiment_manager.model_version,
+                "sentiment_label": row["sentiment_label"],
+                "sentiment_score": float(row["sentiment_score"])
+                }
+            for row in scored_news_df.to_dict("records")
+            ]
+        self.database_manager.write_sentiments(sentiments_rows_list)
+        return None
+
+# Refresh Process State: Each Refresh Process Keeps One Artifact Manager Across Builds
+artifact_manager = None
+
+def build_dash_objects(incremental=False):
+    # Returns Only The Assets Rebuilt By This Build; The Others Are Unchanged
+    global artifact_manager
+    if artifact_manager is None:
+        artifact_manager = ArtifactManager(DataBaseManager())
+        incremental = False
+    dash_objects = artifact_manager.get_dash_objects(artifact_manager.read_data_objects(incremental))
+
+    # Snapshots For Other Workers And Future Boots, One File Per Rebuilt Asset
+    for asset_id in artifact_manager.updated_asset_ids:
+        artifact_manager.snapshot_manager.write_snapshot(
+            asset_id,
+            dash_objects[asset_id],
+            artifact_manager.database_manager.assets_high_water_marks[asset_id]
+            )
+    return {asset_id: dash_objects[asset_id] for asset_id in artifact_manager.updated_asset_ids}
@@ -0,0 +1,182 @@
+"""
+Purpose: A backfill manager for The Daily BTC Web Application.
+"""
+
+import os
+import json
+import time
+import argparse
+import datetime as dt
+from dotenv import load_dotenv
+from sqlalchemy.orm import Session
+from databasemanager import DataBaseManager, Statuses, News
+
+load_dotenv()
+
+class BackfillManager:
+    def __init__(self, database_manager, asset_id=None):
+        # Parameters
+        self.database_manager = database_manager
+        self.asset_id = asset_id # Asset For Rows That Do Not Name One; Defaults To The First Asset (Statuses) Or Matched Names (News)
+        self.chunk_rows = int(os.getenv("BACKFILL_CHUNK_ROWS", 10000)) # Rows Per Transaction And Checkpoint
+        self.stream_extensions = [".ndjson", ".jsonl"] # Read Line By Line; Other Files Are Loaded As One JSON Document
+        self.tables = {
+            "statuses": {
+                "columns": [column.name for column in Statuses.__table__.columns if column.name != "id"],
+                "get_row": self.get_statuses_row,
+                "insert": self.database_manager.insert_statuses
+                },
+            "news": {
+                "columns": [column.name for column in News.__table__.columns if column.name != "id"],
+                "get_row": self.get_news_row,
+                "insert": self.database_manager.insert_news
+                }
+            }
+        return None
+
+    def backfill(self, table_name, file_path):
+        # Each Chunk Is One Transaction Followed By A Checkpoint, So An Interrupted Run Resumes After Its Last Chunk
+        table = self.tables[table_name]
+        checkpoint = self.read_checkpoint(file_path)
+        if checkpoint["completed"]:
+            print(f"{file_path}: already backfilled ({checkpoint['read']:,} read, {checkpoint['inserted']:,} inserted)")
+            return checkpoint
+        start_time = time.perf_counter()
+        start_read = checkpoint["read"]
+        rows_list, position = [], checkpoint["position"]
+        for record, position in self.read_records(file_path, checkpoint["position"]):
+            rows_list.append(table["get_row"](record))
+            if len(rows_list) >= self.chunk_rows:
+                self.store_chunk(table_name, file_path, rows_list, position, checkpoint, start_time, start_read)
+                rows_list = []
+        self.store_chunk(table_name, file_path, rows_list, position, checkpoint, start_time, start_read)
+        checkpoint["completed"] = True
+        self.write_checkpoint(file_path, checkpoint)
+        elapsed_sec = time.perf_counter() - start_time
+        print(
+            f"{file_path}: done, {checkpoint['read'] - start_read:,} rows read in {elapsed_sec:,.1f}s "
+            f"({(checkpoint['read'] - start_read) / max(elapsed_sec, 1e-9):,.0f} rows/s), "
+            f"{checkpoint['inserted']:,} inserted in total"
+            )
+        return checkpoint
+
+    def store_chunk(self, table_name, file_path, rows_list, position, checkpoint, start_time, start_read):
+        # Inserted In Sub-Batches That Fit SQLite's Bound Parameter Limit, Deduplicated Like Live Ingests
+        table = self.tables[table_name]
+        inserted_count = 0
+        with Session(self.database_manager.engine) as session, session.begin():
+            for i in range(0, len(rows_list), self.database_manager.db_max_variables):
+                inserted_count += table["insert"](session, rows_list[i:i + self.database_manager.db_max_variables])
+        checkpoint["position"] = position
+        checkpoint["read"] += len(rows_list)
+        checkpoint["inserted"] += inserted_count
+        self.write_checkpoint(file_path, checkpoint)
+        if len(rows_list) > 0:
+            elapsed_sec = time.perf_counter() - start_time
+            print(
+                f"{file_path}: {checkpoint['read']:,} read, {checkpoint['inserted']:,} inserted "
+                f"({(checkpoint['read'] - start_read) / max(elapsed_sec, 1e-9):,.0f} rows/s)"
+                )
+        return None
+
+    def read_records(self, file_path, position):
+        # Yields Each Record With The Position To Resume After It: A Byte Offset For Streams, An Index Otherwise
+        if os.path.splitext(file_path)[1].lower() in self.stream_extensions:
+            with open(file_path, "rb") as file:
+                file.seek(position)
+                while True:
+                    line = file.readline()
+                    if len(line) == 0:
+                        break
+                    if len(line.strip()) > 0:
+                        yield json.loads(line), file.tell()
+            return None
+        with open(file_path, "r", encoding="utf-8") as file:
+            document = json.load(file)
+        for index, record in enumerate(self.get_document_records(document)):
+            if index >= position:
+                yield record, index + 1
+        return None
+
+    def get_document_records(self, document):
+        # CoinGecko Market Charts Hold Parallel [Timestamp, Value] Series; News API Responses Hold Articles
+        if isinstance(document, dict) and "prices" in document:
+            market_caps = {timestamp: value for timestamp, value in document.get("market_caps", [])}
+            total_volumes = {timestamp: value for timestamp, value in document.get("total_volumes", [])}
+            return (
+                {
+                    "timestamp_ms": timestamp,
+                    "price": price,
+                    "market_cap": market_caps.get(timestamp),
+                    "total_volume": total_volumes.get(timestamp)
+                    }
+                for timestamp, price in document["prices"]
+                )
+        if isinstance(document, dict) and "articles" in document:
+            return document["articles"]
+        return document
+
+    def get_statuses_row(self, record):
+        # Accepts CoinGecko Coin Responses, Market Chart Points Or Rows Shaped Like The Table
+        if "market_data" in record:
+            row = self.database_manager.get_statuses_rows(record)[0]
+        elif "timestamp_ms" in record:
+            timestamp = dt.datetime.fromtimestamp(record["timestamp_ms"] / 1000, tz=dt.timezone.utc)
+            row = {
+                "price_usd": record["price"],
+                "market_cap_usd": round(record["market_cap"]) if record.get("market_cap") is not None else None,
+                "total_volume_usd": round(record["total_volume"]) if record.get("total_volume") is not None else None,
+                "last_updated_timestamp": timestamp.strftime("%Y-%m-%dT%H:%M:%S.%f")[:-3] + "Z", # Same Format As Live Rows
+                "last_updated_date": timestamp.strftime("%Y-%m-%d")
+                }
+        else:
+            row = record
+        statuses_row = {column: row.get(column) for column in self.tables["statuses"]["columns"]}
+        if statuses_row["asset_id"] is None:
+            statuses_row["asset_id"] = self.asset_id or self.database_manager.asset_ids[0]
+        return statuses_row
+
+    def get_news_row(self, record):
+        # Accepts News API Articles Or Rows Shaped Like The Table
+        row = self.database_manager.get_news_rows({"articles": [record]})[0] if "publishedAt" in record else record
+        news_row = {column: row.get(column) for column in self.tables["news"]["columns"]}
+        news_row["asset_ids"] = (
+            [self.asset_id]
+            if self.asset_id is not None
+            else row.get("asset_ids") or self.database_manager.get_news_asset_ids(row)
+            )
+        return news_row
+
+    def get_checkpoint_path(self, file_path):
+        return f"{file_path}.checkpoint"
+
+    def read_checkpoint(self, file_path):
+        try:
+            with open(self.get_checkpoint_path(file_path), "r", encoding="utf-8") as file:
+                return json.load(file)
+        except FileNotFoundError:
+            return {"position": 0, "read": 0, "inserted": 0, "completed": False}
+
+    def write_checkpoint(self, file_path, checkpoint):
+        # Written Beside The File And Renamed Into Place, So A Crash Never Leaves A Partial Checkpoint
+        checkpoint_path = self.get_checkpoint_path(file_path)
+        with open(f"{checkpoint_path}.tmp", "w", encoding="utf-8") as file:
+            json.dump(checkpoint, file)
+        os.replace(f"{checkpoint_path}.tmp", checkpoint_path)
+        return None
+
+if __name__ == "__main__":
+    # Usage: python backfillmanager.py statuses market_chart.json --asset-id ethereum
+    #        python backfillmanager.py news articles-2023.ndjson articles-2024.ndjson
+    parser = argparse.ArgumentParser(description="Backfill historical statuses or news from JSON/NDJSON files.")
+    parser.add_argument("table_name", choices=["statuses", "news"])
+    parser.add_argument("file_paths", nargs="+")
+    parser.add_argument("--chunk-rows", type=int, default=None)
+    parser.add_argument("--asset-id", default=None)
+    arguments = parser.parse_args()
+
+    backfill_manager = BackfillManager(DataBaseManager(), arguments.asset_id)
+    if arguments.chunk_rows is not None:
+        backfill_manager.chunk_rows = arguments.chunk_rows
+    for file_path in arguments.file_paths:
+        backfill_manager.backfill(arguments.table_name, file_path)
@@ -0,0 +1,412 @@
+"""
+Purpose: A chart manager for The Daily BTC Web Application.
+"""
+
+import os
+import json
+import time
+import numpy as np
+import pandas as pd
+import plotly.io as pio
+import plotly.graph_objects as go
+from dotenv import load_dotenv
+from plotly.io.json import to_json_plotly
+
+load_dotenv()
+
+class ChartManager:
+    def __init__(self):
+        # Parameters
+        self.chart_max_points = int(os.getenv("CHART_MAX_POINTS", 500)) # Longer Histories Are Downsampled
+        self.chart_max_ticks = 60 # Daily Ticks Up To Two Months, Then Coarser
+        self.chart_tick_spacings = [ # Plotly dtick Values: Days In Milliseconds, Then Months
+            86400000, 2 * 86400000, 7 * 86400000, 14 * 86400000, "M1", "M2", "M3", "M6", "M12", "M24"
+            ]
+        self.chart_marker_points = 90 # Full-Size Markers Up To This Many Points
+
+        # Figure Templates: Figures Are Plain Dicts Built From These, Skipping graph_objects Validation
+        self.figure_template = pio.templates[pio.templates.default].to_plotly_json()
+        self.layout_styles = {
+            "font": {"color": "white"},
+            "plot_bgcolor": "#227B94",
+            "paper_bgcolor": "#227B94"
+            }
+
+        # Charts: Section, Plotted Columns And Builder For Each Figure
+        self.charts = {
+            "prices": {
+                "section": "economics",
+                "columns": ["price_usd", "price_ema50_usd", "price_ema200_usd"],
+                "builder": self.get_prices_figure
+                },
+            "market_caps": {
+                "section": "economics",
+                "columns": ["market_cap_usd", "fully_diluted_valuation_usd"],
+                "builder": self.get_market_caps_figure
+                },
+            "total_volumes": {
+                "section": "economics",
+                "columns": ["total_volume_usd"],
+                "builder": self.get_total_volumes_figure
+                },
+            "github": {
+                "section": "socials",
+                "columns": ["github_total_issues_count", "github_closed_issues_count"],
+                "builder": self.get_github_figure
+                },
+            "twitter": {
+                "section": "socials",
+                "columns": ["twitter_followers_count"],
+                "builder": self.get_twitter_figure
+                }
+            }
+        return None
+
+    def get_chart_df(self, daily_statuses_df):
+        chart_df = pd.DataFrame(daily_statuses_df).reset_index(drop=True) # Gaps Are Dropped Per Chart
+        chart_df["last_updated_date"] = pd.to_datetime(chart_df["last_updated_date"], utc=True)
+        return chart_df
+
+    def get_chart_figures(self, chart_df):
+        chart_figures = {}
+        for chart_name, chart in self.charts.items():
+            chart_figures.setdefault(chart["section"], {})[chart_name] = self.get_chart_figure(chart_name, chart_df)
+        return chart_figures
+
+    def get_chart_figure(self, chart_name, chart_df):
+        chart = self.charts[chart_name]
+        fig_df = chart_df.dropna(subset=chart["columns"], how="all").reset_index(drop=True) # Partial Days Draw As Gaps
+        if len(fig_df) == 0: # Such As Social Charts Before The First Live Status
+            return {"data": [], "layout": {"template": self.figure_template, **self.layout_styles}}
+        fig_df = self.downsample_chart_df(fig_df, chart["columns"])
+        return chart["builder"](fig_df, 12 if len(fig_df) <= self.chart_marker_points else 4)
+
+    def downsample_chart_df(self, chart_df, columns_list):
+        # Min/Max Buckets: Each Bucket Keeps Its Extremes Per Column, So Peaks And Troughs Survive
+        if self.chart_max_points is None or len(chart_df) <= self.chart_max_points:
+            return chart_df
+        buckets_count = max(self.chart_max_points // (2 * len(columns_list)), 1)
+        buckets = np.arange(len(chart_df)) * buckets_count // len(chart_df)
+        kept_positions = {0, len(chart_df) - 1} # First And Last Points Carry The Chart Labels
+        for column in columns_list:
+            column_values = chart_df[column].reset_index(drop=True).dropna() # Days Missing The Column Are Skipped
+            grouped_values = column_values.groupby(buckets[column_values.index.to_numpy()])
+            kept_positions.update(grouped_values.idxmin().to_list())
+            kept_positions.update(grouped_values.idxmax().to_list())
+        return chart_df.iloc[sorted(kept_positions)].reset_index(drop=True)
+
+    def get_tick_spacing(self, fig_df):
+        # Smallest Spacing That Keeps The Axis Under chart_max_ticks Labels
+        span_days = (fig_df["last_updated_date"].max() - fig_df["last_updated_date"].min()).days + 2
+        for tick_spacing in self.chart_tick_spacings:
+            spacing_days = (
+                tick_spacing / 86400000
+                if isinstance(tick_spacing, int)
+                else int(tick_spacing[1:]) * 30.4
+                )
+            if span_days / spacing_days <= self.chart_max_ticks:
+                return tick_spacing
+        return self.chart_tick_spacings[-1]
+
+    def get_xaxis_styles(self, fig_df):
+        xaxis_styles = {
+            "tickformat": "%b %d, %Y",
+            "tickangle": 90,
+            "dtick": self.get_tick_spacing(fig_df),
+            "range": [
+                min(fig_df["last_updated_date"]) - pd.DateOffset(days=1),
+                max(fig_df["last_updated_date"]) + pd.DateOffset(days=1)
+                ]
+            }
+        return xaxis_styles
+
+    def get_prices_figure(self, fig_df, marker_size):
+        x = fig_df["last_updated_date"].to_numpy()
+        fig_prices = {
+            "data": [
+                {
+                    "line": {"color": "red"},
+                    "marker": {"size": marker_size},
+                    "mode": "lines+markers",
+                    "name": "SPOT",
+                    "x": x,
+                    "y": fig_df["price_usd"].to_numpy(),
+                    "type": "scatter"
+                    },
+                {
+                    "line": {"color": "yellow", "dash": "dot"},
+                    "marker": {"size": marker_size},
+                    "mode": "lines+markers",
+                    "name": "EMA 50",
+                    "x": x,
+                    "y": fig_df["price_ema50_usd"].to_numpy(),
+                    "type": "scatter"
+                    },
+                {
+                    "line": {"color": "lime", "dash": "dash"},
+                    "marker": {"size": marker_size},
+                    "mode": "lines+markers",
+                    "name": "EMA 200",
+                    "x": x,
+                    "y": fig_df["price_ema200_usd"].to_numpy(),
+                    "type": "scatter"
+                    }
+                ],
+            "layout": {
+                "template": self.figure_template,
+                "xaxis": {"showline": True, "showgrid": False, "title": {"text": "DATE"}, **self.get_xaxis_styles(fig_df)},
+                "yaxis": {
+                    "showline": True,
+                    "showgrid": False,
+                    "range": [fig_df["price_usd"].min() * 0.95, fig_df["price_usd"].max() * 1.05] # Skipping Missing Days
+                    },
+                "title": {"text": "DAILY AVERAGE PRICE ($)", "x": 0.5},
+                **self.layout_styles
+                }
+            }
+        return fig_prices
+
+    def get_market_caps_figure(self, fig_df, marker_size):
+        x = fig_df["last_updated_date"].to_numpy()
+        fig_market_caps = {
+            "data": [
+                {
+                    "line": {"color": "red"},
+                    "marker": {"size": marker_size},
+                    "mode": "lines+markers",
+                    "name": "IN CIRCULATION",
+                    "x": x,
+                    "y": fig_df["market_cap_usd"].to_numpy(),
+                    "type": "scatter"
+                    },
+                {
+                    "line": {"color": "yellow"},
+                    "marker": {"size": marker_size},
+                    "mode": "lines+markers",
+                    "name": "FULLY DILUTED",
+                    "x": x,
+                    "y": fig_df["fully_diluted_valuation_usd"].to_numpy(),
+                    "type": "scatter"
+                    }
+                ],
+            "layout": {
+                "template": self.figure_template,
+                "xaxis": {"showline": True, "showgrid": False, "title": {"text": "DATE"}, **self.get_xaxis_styles(fig_df)},
+                "yaxis": {
+                    "showline": True,
+                    "showgrid": False,
+                    "range": [ # Over Both Series, As Either May Be Missing, Such As Backfilled Market Caps Without FDV
+                        fig_df[["market_cap_usd", "fully_diluted_valuation_usd"]].min().min() * 0.95,
+                        fig_df[["market_cap_usd", "fully_diluted_valuation_usd"]].max().max() * 1.05
+                        ]
+                    },
+                "title": {"text": "DAILY AVERAGE MARKET CAP ($)", "x": 0.5},
+                **self.layout_styles
+                }
+            }
+        return fig_market_caps
+
+    def get_total_volumes_figure(self, fig_df, marker_size):
+        fig_total_volumes = {
+            "data": [
+                {
+                    "marker": {"color": "lime"},
+                    "x": fig_df["last_updated_date"].to_numpy(),
+                    "y": fig_df["total_volume_usd"].to_numpy(),
+                    "type": "bar"
+                    }
+                ],
+            "layout": {
+                "template": self.figure_template,
+                "yaxis": {"range": [0, fig_df["total_volume_usd"].max() * 1.05]},
+                "title": {"text": "DAILY AVERAGE TOTAL VOLUME ($)", "x": 0.5},
+                "xaxis": {"title": {"text": "DATE"}, **self.get_xaxis_styles(fig_df)},
+                **self.layout_styles
+                }
+            }
+        return fig_total_volumes
+
+    def get_github_figure(self, fig_df, marker_size):
+        x = fig_df["last_updated_date"].to_numpy()
+        fig_github = {
+            "data": [
+                {
+                    "fill": "tozeroy",
+                    "line": {"color": "red"},
+                    "mode": "lines",
+                    "name": "OPENED",
+                    "x": x,
+                    "y": fig_df["github_total_issues_count"].to_numpy(),
+                    "type": "scatter"
+                    },
+                {
+                    "fill": "tozeroy",
+                    "line": {"color": "lime"},
+                    "mode": "lines",
+                    "name": "CLOSED",
+                    "x": x,
+                    "y": fig_df["github_closed_issues_count"].to_numpy(),
+                    "type": "scatter"
+                    },
+                {
+                    "line": {"color": "red"},
+                    "mode": "lines+text",
+                    "showlegend": False,
+                    "text": [f"{fig_df['github_total_issues_count'].iloc[-1]:,.0f}"], # Counts Read As Floats Once A Day Lacks Them
+                    "textfont": {"color": "red", "size": 12},
+                    "textposition": "middle right",
+                    "x": x[-1:],
+                    "y": fig_df["github_total_issues_count"].to_numpy()[-1:],
+                    "type": "scatter"
+                    },
+                {
+                    "line": {"color": "lime"},
+                    "mode": "lines+text",
+                    "showlegend": False,
+                    "text": [f"{fig_df['github_closed_issues_count'].iloc[-1]:,.0f}"],
+                    "textfont": {"color": "lime", "size": 12},
+                    "textposition": "middle right",
+                    "x": x[-1:],
+                    "y": fig_df["github_closed_issues_count"].to_numpy()[-1:],
+                    "type": "scatter"
+                    }
+                ],
+            "layout": {
+                "template": self.figure_template,
+                "xaxis": {"showgrid": False, "title": {"text": "DATE"}, **self.get_xaxis_styles(fig_df)},
+                "yaxis": {"showgrid": False, "showticklabels": False},
+                "title": {"text": "DAILY TOTAL NUMBER OF ISSUES", "x": 0.5},
+                **self.layout_styles
+                }
+            }
+        return fig_github
+
+    def get_twitter_figure(self, fig_df, marker_size):
+        x = fig_df["last_updated_date"].to_numpy()
+        y = fig_df["twitter_followers_count"].to_numpy()
+        fig_twitter = {
+            "data": [
+                {
+                    "marker": {"color": "yellow", "size": marker_size},
+                    "mode": "markers",
+                    "x": x,
+                    "y": y,
+                    "type": "scatter"
+                    },
+                {
+                    "marker": {"color": "yellow", "size": 12},
+                    "mode": "markers+text",
+                    "text": [f"{y[0]:,.0f}"], # Counts Read As Floats Once A Day Lacks Them
+                    "textfont": {"color": "yellow"},
+                    "textposition": "top center",
+                    "x": x[:1],
+                    "y": y[:1],
+                    "type": "scatter"
+                    },
+                {
+                    "marker": {"color": "yellow", "size": 12},
+                    "mode": "markers+text",
+                    "text": [f"{y[-1]:,.0f}"],
+                    "textfont": {"color": "yellow"},
+                    "textposition": "top center",
+                    "x": x[-1:],
+                    "y": y[-1:],
+                    "type": "scatter"
+                    }
+                ],
+            "layout": {
+                "template": self.figure_template,
+                "xaxis": {"showline": True, "showgrid": False, "title": {"text": "DATE"}, **self.get_xaxis_styles(fig_df)},
+                "yaxis": {
+                    "showgrid": False,
+                    "showticklabels": False,
+                    "range": [np.nanmin(y) * 0.95, np.nanmax(y) * 1.05]
+                    },
+                "title": {"text": "DAILY TOTAL NUMBER OF FOLLOWERS", "x": 0.5},
+                "showlegend": False,
+                **self.layout_styles
+                }
+            }
+        return fig_twitter
+
+    def benchmark(self, chart_df):
+        # Payload Size And Build Time With And Without Downsampling
+        chart_max_points = self.chart_max_points
+        benchmark_results = []
+        for max_points in [None, chart_max_points]:
+            self.chart_max_points = max_points
+            start_time = time.perf_counter()
+            chart_figures = self.get_chart_figures(chart_df)
+            build_sec = time.perf_counter() - start_time
+            benchmark_results.append(
+                {
+                    "days": len(chart_df),
+                    "max_points": max_points,
+                    "build_sec": build_sec,
+                    "payload_bytes": len(to_json_plotly(chart_figures))
+                    }
+                )
+        self.chart_max_points = chart_max_points
+        return benchmark_results
+
+    def compare_figure_paths(self, chart_df, repeats_count=20):
+        # Dict Figures Against The Same Figures Passed Through graph_objects Validation, As Before
+        start_time = time.perf_counter()
+        for _ in range(repeats_count):
+            chart_figures = self.get_chart_figures(chart_df)
+        dict_sec = (time.perf_counter() - start_time) / repeats_count
+        start_time = time.perf_counter()
+        for _ in range(repeats_count):
+            validated_figures = {
+                section: {
+                    chart_name: go.Figure(fig_object).to_plotly_json()
+                    for chart_name, fig_object in section_figures.items()
+                    }
+                for section, section_figures in self.get_chart_figures(chart_df).items()
+                }
+        validated_sec = (time.perf_counter() - start_time) / repeats_count
+        comparison_results = {
+            "days": len(chart_df),
+            "dict_sec": dict_sec,
+            "validated_sec": validated_sec,
+            "identical": json.loads(to_json_plotly(chart_figures)) == json.loads(to_json_plotly(validated_figures))
+            }
+        return comparison_results
+
+def get_synthetic_chart_df(days_count):
+    # Random-Walk Daily History Shaped Like The Daily Rollup
+    random_generator = np.random.default_rng(0)
+    price_usd = 60000 * np.exp(np.cumsum(random_generator.normal(0, 0.03, days_count)))
+    return pd.DataFrame(
+        {
+            "last_updated_date": pd.date_range(end=pd.Timestamp.utcnow().floor("D"), periods=days_count),
+            "price_usd": price_usd,
+            "price_ema50_usd": pd.Series(price_usd).ewm(span=50, adjust=False).mean(),
+            "price_ema200_usd": pd.Series(price_usd).ewm(span=200, adjust=False).mean(),
+            "market_cap_usd": price_usd * 19.7e6,
+            "fully_diluted_valuation_usd": price_usd * 21e6,
+            "total_volume_usd": random_generator.uniform(1e10, 5e10, days_count),
+            "twitter_followers_count": np.arange(days_count) * 100 + 6000000,
+            "github_total_issues_count": np.arange(days_count) // 3 + 7000,
+            "github_closed_issues_count": np.arange(days_count) // 3 + 6500
+            }
+        )
+
+if __name__ == "__main__":
+    # Downsampling Benchmark At 1, 5 And 10 Years Of Synthetic History
+    chart_manager = ChartManager()
+    for years in [1, 5, 10]:
+        for result in chart_manager.benchmark(get_synthetic_chart_df(years * 365)):
+            print(
+                f"years={years:>2} max_points={str(result['max_points']):>4} "
+                f"build={result['build_sec'] * 1000:,.0f} ms payload={result['payload_bytes'] / 1024:,.0f} KB"
+                )
+
+    # Figure Construction: Plain Dicts Against graph_objects Validation
+    for days_count in [60, 365, 3650]:
+        result = chart_manager.compare_figure_paths(get_synthetic_chart_df(days_count))
+        print(
+            f"days={result['days']:>4} dict={result['dict_sec'] * 1000:,.1f} ms "
+            f"graph_objects={result['validated_sec'] * 1000:,.1f} ms "
+            f"speedup={result['validated_sec'] / result['dict_sec']:,.1f}x identical={result['identical']}"
+            )
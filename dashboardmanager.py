@@ -2,372 +2,261 @@
 Purpose: A dashboard manager for The Daily BTC Web Application.
 """
 
-from dash import Dash, html, dcc, get_asset_url
+from dash import Dash, html, dcc, Input, Output, no_update
 import dash_bootstrap_components as dbc
-import pandas as pd
-import plotly.graph_objects as go
-from transformers import pipeline
+import os
+import re
+import gzip
+import time
+import flask
+import hashlib
+import multiprocessing
+from plotly.io.json import to_json_plotly
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from dotenv import load_dotenv
+from artifactmanager import build_dash_objects
+from snapshotmanager import SnapshotManager
+from chartmanager import ChartManager
+
+try:
+    import brotli
+except ImportError: # Optional; Responses Fall Back To gzip
+    brotli = None
+
+load_dotenv()
 
 class DashBoardManager:
-    def __init__(self, app, data_objects):
+    def __init__(self, app, database_manager):
         # Parameters
-        self.dashboard = Dash(
-            server=app,
-            external_stylesheets=[dbc.themes.BOOTSTRAP],
-            routes_pathname_prefix="/home/"
-            )
-        self.dashboard.title = "The Daily BTC"
-        self.dashboard._favicon = "favicon.ico"
+        self.database_manager = database_manager
+        self.assets_symbols = { # Asset ID: Symbol Shown In Its Page's Title; Assets Not Listed Show Their ID
+            asset_symbol.split(":")[0].strip(): asset_symbol.split(":")[1].strip().upper()
+            for asset_symbol in os.getenv("ASSET_SYMBOLS", "bitcoin:BTC").split(",")
+            if ":" in asset_symbol
+            }
+
+        # Dashboards: One Dash App Per Asset, The First At /home/ And The Others At /home/<asset_id>/,
+        # So Each Asset Page Has Its Own Layout URL And Can Be Cached Like A Single Page
+        self.dashboards = {asset_id: self.get_dashboard(app, asset_id) for asset_id in self.database_manager.asset_ids}
+        self.dashboard = self.dashboards[self.database_manager.asset_ids[0]]
 
-        # Calculations
-        self.sentiment_pipeline = pipeline(
-            task="sentiment-analysis", 
-            model="cardiffnlp/twitter-roberta-base-sentiment"
+        # Refresh Process: Sentiment Inference And Figures Are Built Off The Request-Serving Process
+        self.refresh_executor = None # Started On The First Build, So Followers Never Start One
+
+        # Snapshots: Built Artifacts Shared On Disk Between Workers And Restarts, One Per Asset
+        self.snapshot_manager = SnapshotManager()
+        self.snapshots_mtimes = {}
+
+        # Compression And Caching For Static Responses
+        self.compression_min_bytes = 1024
+        self.component_suites_url_prefixes = tuple(
+            dashboard.config.routes_pathname_prefix + "_dash-component-suites/" for dashboard in self.dashboards.values()
             )
-        self.news_df = pd.DataFrame()
-        self.news_empty_post = {
-            "source_name": "",
-            "author": "",
-            "title": "",
-            "subtitle": "",
-            "url_to_post": "",
-            "url_to_image": "",
-            "published_date": ""
+        self.component_suites_cache = {} # (Path, Encoding): Compressed Bytes
+        self.assets_url_prefixes = tuple(dashboard.get_asset_url("") for dashboard in self.dashboards.values())
+        self.asset_hashes = {} # Asset Name: Content Hash, For Immutable URLs
+        app.after_request(self.set_response_encoding_and_caching)
+
+        # Layout: Served Right Away From Each Asset's Snapshot, Or A Placeholder Until Its First Build Lands
+        self.dash_objects = {} # Asset ID: Dashboard Objects
+        for asset_id in self.database_manager.asset_ids:
+            self.load_snapshot(asset_id)
+
+        # Layout Cache: Serialized And Compressed Once Per Asset And dash_objects Version, Served With Strong ETags
+        self.layout_caches = {
+            asset_id: {"dash_objects": None, "payloads": None, "etag": None}
+            for asset_id in self.database_manager.asset_ids
             }
+        self.chart_manager = ChartManager()
+        for asset_id, dashboard in self.dashboards.items():
+            dashboard.layout = self.get_dash_layout_function(asset_id)
+            app.view_functions[dashboard.config.routes_pathname_prefix + "_dash-layout"] = self.get_serve_dash_layout_function(asset_id)
 
-        # Layout
-        self.dash_objects = self.get_dash_objects(data_objects)
-        self.dashboard.layout = self.get_dash_layout
+            # Chart Zoom: Zoomed Windows Are Redrawn From The DataBase At Full Resolution
+            for chart_name in self.chart_manager.charts:
+                dashboard.callback(
+                    Output(f"{chart_name}-graph", "figure"),
+                    Input(f"{chart_name}-graph", "relayoutData"),
+                    prevent_initial_call=True
+                    )(self.get_chart_zoom_callback(asset_id, chart_name))
         return None
-    
-    def get_dash_objects(self, data_objects):
-        # Economic & Social Charts Calculations
-        statuses_df = pd.DataFrame(data_objects['statuses']).dropna()
-        statuses_df["last_updated_date"] = pd.to_datetime(statuses_df["last_updated_date"], utc=True)
-        fig_columns = [
-            "last_updated_date", 
-            "price_usd", "market_cap_usd", "fully_diluted_valuation_usd", "total_volume_usd",
-            "twitter_followers_count", "github_total_issues_count", "github_closed_issues_count",
-            "github_pull_requests_merged_count", "github_pull_request_contributors_count"
-            ]
-        fig_df = (
-            statuses_df[fig_columns].groupby("last_updated_date")
-            .agg(
-                {
-                    "price_usd": "mean",
-                    "market_cap_usd": "mean",
-                    "fully_diluted_valuation_usd": "mean",
-                    "total_volume_usd": "mean",
-                    "twitter_followers_count": "max",
-                    "github_total_issues_count": "max",
-                    "github_closed_issues_count": "max",
-                    "github_pull_requests_merged_count": "max", 
-                    "github_pull_request_contributors_count": "max"
-                    }
-                ).sort_index().reset_index()
-            )
-        fig_df["price_ema50_usd"] = fig_df["price_usd"].ewm(span=50, adjust=False).mean()
-        fig_df["price_ema200_usd"] = fig_df["price_usd"].ewm(span=200, adjust=False).mean()
-
-        # Economic Charts Designs
-        fig_prices = go.Figure()
-        fig_prices.add_trace(
-            go.Scatter(
-                x=fig_df["last_updated_date"], 
-                y=fig_df["price_usd"],
-                line={"color": "red"},
-                marker={"size": 12},
-                mode='lines+markers',
-                name="SPOT"
-                )
-            )
-        fig_prices.add_trace(
-            go.Scatter(
-                x=fig_df["last_updated_date"], 
-                y=fig_df["price_ema50_usd"],
-                line={"color": "yellow", "dash": "dot"},
-                marker={"size": 12},
-                mode='lines+markers',
-                name="EMA 50"
-                )
-            )
-        fig_prices.add_trace(
-            go.Scatter(
-                x=fig_df["last_updated_date"], 
-                y=fig_df["price_ema200_usd"],
-                line={"color": "lime", "dash": "dash"},
-                marker={"size": 12},
-                mode='lines+markers',
-                name="EMA 200"
-                )
-            )
-        fig_prices.update_layout(
-            xaxis={"showline": True, "showgrid": False, "title": "DATE"},
-            yaxis={
-                "showline": True, 
-                "showgrid": False, 
-                "range": [min(fig_df["price_usd"]) * 0.95, max(fig_df["price_usd"]) * 1.05]
-                },
-            title={"text": "DAILY AVERAGE PRICE ($)", "x": 0.5}
-            )
 
-        fig_market_caps = go.Figure()
-        fig_market_caps.add_trace(
-            go.Scatter(
-                x=fig_df["last_updated_date"], 
-                y=fig_df["market_cap_usd"], 
-                line={"color": "red"},
-                marker={"size": 12},
-                mode='lines+markers', 
-                name="IN CIRCULATION"
-                )
-            )
-        fig_market_caps.add_trace(
-            go.Scatter(
-                x=fig_df["last_updated_date"], 
-                y=fig_df["fully_diluted_valuation_usd"], 
-                line={"color": "yellow"},
-                marker={"size": 12},
-                mode='lines+markers',
-                name="FULLY DILUTED"
-                )
-            )
-        fig_market_caps.update_layout(
-            xaxis={"showline": True, "showgrid": False, "title": "DATE"},
-            yaxis={
-                "showline": True,
-                "showgrid": False,
-                "range": [
-                    min(fig_df["market_cap_usd"]) * 0.95, 
-                    max(fig_df["fully_diluted_valuation_usd"]) * 1.05
-                    ]
-                },
-            title={"text": "DAILY AVERAGE MARKET CAP ($)", "x": 0.5}
+    def get_dashboard(self, app, asset_id):
+        dashboard = Dash(
+            server=app,
+            external_stylesheets=[dbc.themes.BOOTSTRAP],
+            routes_pathname_prefix=self.get_asset_pathname(asset_id),
+            suppress_callback_exceptions=True # Graphs Are Absent From The Placeholder Layout
             )
+        dashboard.title = self.get_asset_title(asset_id)
+        dashboard._favicon = "favicon.ico"
 
-        fig_total_volumes = go.Figure()
-        fig_total_volumes.add_trace(
-            go.Bar(
-                x=fig_df["last_updated_date"], 
-                y=fig_df["total_volume_usd"],
-                marker={"color": "lime"},
+        # Without Its Trailing Slash, An Asset Page Would Be Caught By The Default Page's Routes
+        if asset_id != self.database_manager.asset_ids[0]:
+            app.add_url_rule(
+                dashboard.config.routes_pathname_prefix.rstrip("/"),
+                endpoint=f"{dashboard.config.routes_pathname_prefix}redirect",
+                view_func=lambda: flask.redirect(dashboard.config.routes_pathname_prefix)
                 )
-            )
-        fig_total_volumes.update_layout(
-            xaxis={"title": "DATE"},
-            yaxis={"range": [0, max(fig_df["total_volume_usd"]) * 1.05]},
-            title={"text": "DAILY AVERAGE TOTAL VOLUME ($)", "x": 0.5}
-            )
+        return dashboard
 
-        # Social Charts Designs
-        fig_github = go.Figure()
-        fig_github.add_trace(
-            go.Scatter(
-                x=fig_df["last_updated_date"], 
-                y=fig_df["github_total_issues_count"],
-                mode="lines",
-                line={"color": "red"},
-                name="OPENED",
-                fill='tozeroy'
-                )
-            )
-        fig_github.add_trace(
-            go.Scatter(
-                x=fig_df["last_updated_date"], 
-                y=fig_df["github_closed_issues_count"],
-                mode="lines",
-                line={"color": "lime"},
-                name="CLOSED",
-                fill='tozeroy'
-                )
-            )
-        fig_github.add_trace(
-            go.Scatter(
-                x=[fig_df["last_updated_date"].tolist()[-1]], 
-                y=[fig_df["github_total_issues_count"].tolist()[-1]],
-                mode="lines+text",
-                line={"color": "red"},
-                text=[f"{fig_df['github_total_issues_count'].tolist()[-1]:,}"],
-                textfont={"color": "red", "size": 12},
-                textposition="middle right",
-                showlegend=False
-                )
-            )
-        fig_github.add_trace(
-            go.Scatter(
-                x=[fig_df["last_updated_date"].tolist()[-1]], 
-                y=[fig_df["github_closed_issues_count"].tolist()[-1]],
-                mode="lines+text",
-                line={"color": "lime"},
-                text=[f"{fig_df['github_closed_issues_count'].tolist()[-1]:,}"],
-                textfont={"color": "lime", "size": 12},
-                textposition="middle right",
-                showlegend=False
-                )
-            )
-        fig_github.update_layout(
-            xaxis={"showgrid": False, "title": "DATE"},
-            yaxis={"showgrid": False, "showticklabels": False},
-            title = {"text": "DAILY TOTAL NUMBER OF ISSUES", "x": 0.5}
-            )
+    def get_asset_pathname(self, asset_id):
+        return "/home/" if asset_id == self.database_manager.asset_ids[0] else f"/home/{asset_id}/"
 
-        fig_twitter = go.Figure()
-        fig_twitter.add_trace(
-            go.Scatter(
-                x=fig_df["last_updated_date"], 
-                y=fig_df["twitter_followers_count"],
-                mode='markers',
-                marker={"color": "yellow", "size": 12},
-                )
-            )
-        fig_twitter.add_trace(
-            go.Scatter(
-                x=[fig_df["last_updated_date"].tolist()[0]], 
-                y=[fig_df["twitter_followers_count"].tolist()[0]],
-                mode='markers+text',
-                marker={"color": "yellow", "size": 12},
-                text=[f"{fig_df['twitter_followers_count'].tolist()[0]:,}"],
-                textfont={"color": "yellow"},
-                textposition="top center"
-                )
+    def get_asset_title(self, asset_id):
+        return f"The Daily {self.assets_symbols.get(asset_id, asset_id.upper())}"
+
+    def load_snapshot(self, asset_id):
+        snapshot_mtime = self.snapshot_manager.get_snapshot_mtime(asset_id)
+        snapshot = self.snapshot_manager.read_snapshot(asset_id)
+        if snapshot is not None:
+            self.dash_objects = {**self.dash_objects, asset_id: snapshot["dash_objects"]}
+            self.snapshots_mtimes[asset_id] = snapshot_mtime
+        return snapshot
+
+    def is_snapshot_stale(self):
+        high_water_marks = self.database_manager.read_high_water_marks()
+        return any(
+            self.snapshot_manager.is_stale(self.snapshot_manager.read_snapshot(asset_id), high_water_marks[asset_id])
+            for asset_id in self.database_manager.asset_ids
             )
-        fig_twitter.add_trace(
-            go.Scatter(
-                x=[fig_df["last_updated_date"].tolist()[-1]], 
-                y=[fig_df["twitter_followers_count"].tolist()[-1]],
-                mode='markers+text',
-                marker={"color": "yellow", "size": 12},
-                text=[f"{fig_df['twitter_followers_count'].tolist()[-1]:,}"],
-                textfont={"color": "yellow"},
-                textposition="top center"
+
+    def get_refresh_executor(self):
+        # Spawned, Not Forked, So The Child Never Inherits The Scheduler's Threads
+        if self.refresh_executor is None:
+            self.refresh_executor = ProcessPoolExecutor(
+                max_workers=1, 
+                mp_context=multiprocessing.get_context("spawn")
                 )
-            )
-        fig_twitter.update_layout(
-            xaxis={"showline": True, "showgrid": False, "title": "DATE" },
-            yaxis={
-                "showgrid": False, 
-                "showticklabels": False,
-                "range": [
-                    min(fig_df["twitter_followers_count"]) * 0.95, 
-                    max(fig_df["twitter_followers_count"]) * 1.05
-                    ]
-                },
-            title={"text": "DAILY TOTAL NUMBER OF FOLLOWERS", "x": 0.5},
-            showlegend=False
-            )
+        return self.refresh_executor
+    
+    def get_layout_cache(self, asset_id):
+        # Pick Up Snapshots Written By Other Processes
+        if self.snapshot_manager.get_snapshot_mtime(asset_id) != self.snapshots_mtimes.get(asset_id):
+            self.load_snapshot(asset_id)
 
-        # General Charts Styles
-        for fig_object in [fig_prices, fig_market_caps, fig_total_volumes, fig_github, fig_twitter]:
-            fig_object.update_layout(
-                xaxis = {
-                    "tickformat": "%b %d, %Y",
-                    "tickangle": 90,
-                    "dtick": 86400000,
-                    "range": [
-                        min(fig_df["last_updated_date"]) - pd.DateOffset(days=1), 
-                        max(fig_df["last_updated_date"]) + pd.DateOffset(days=1)
-                        ]
+        # Rebuilt Only When The Asset's dash_objects Have Been Replaced
+        layout_cache = self.layout_caches[asset_id]
+        if layout_cache["dash_objects"] is not self.dash_objects.get(asset_id) or layout_cache["payloads"] is None:
+            dash_objects = self.dash_objects.get(asset_id)
+            payload = to_json_plotly(self.get_dash_layout(asset_id, dash_objects)).encode("utf-8")
+            layout_cache = {
+                "dash_objects": dash_objects,
+                "payloads": {
+                    encoding: self.compress_payload(payload, encoding) 
+                    for encoding in self.get_supported_encodings()
                     },
-                plot_bgcolor = "#227B94",
-                paper_bgcolor = "#227B94",
-                font_color = "white"
-                )
+                "etag": hashlib.sha256(payload).hexdigest()
+                }
+            self.layout_caches[asset_id] = layout_cache
+        return layout_cache
 
-        # News Charts Calculations
-        temp_news_df = pd.DataFrame(data_objects['news']).dropna()
-        temp_news_df = temp_news_df.loc[
-            [
-                news_id not in self.news_df["id"].to_list() 
-                if len(self.news_df) > 0
-                else True 
-                for news_id in temp_news_df['id']
-                ]
-            ]
-        if len(temp_news_df) > 0:
-            temp_news_df["published_date"] = pd.to_datetime(temp_news_df["published_date"], utc=True)
-            temp_news_df["subtitle"] = (
-                "By "+ temp_news_df["author"] +
-                " on " + temp_news_df["published_date"].dt.strftime("%b %d, %Y")
-                )
-            temp_news_df["content_preview"] = (
-                "Title: " + temp_news_df["title"] + 
-                " Description: " + temp_news_df["description"]
-                )
-            sentiment_results = (
-                pd.DataFrame(self.sentiment_pipeline(temp_news_df["content_preview"].to_list()))
-                .rename(columns={"label": "sentiment_label", "score": "sentiment_score"})
-                .replace({"LABEL_0": "NEGATIVE", "LABEL_1": "NEUTRAL", "LABEL_2": "POSITIVE"})
-                )
-            temp_news_df = pd.concat(
-                [temp_news_df.reset_index(drop=True), sentiment_results.reset_index(drop=True)], 
-                axis="columns",
-                )
-            if len(self.news_df) == 0:
-                self.news_df = temp_news_df.copy()
-            else:
-                self.news_df = pd.concat(
-                    [self.news_df.reset_index(drop=True), temp_news_df.reset_index(drop=True)], 
-                    axis="index", 
-                    ignore_index=True
-                    )
-        
-        # News Charts Subsets
-        news_today = (
-            self.news_df[self.news_df["published_date"] >= pd.to_datetime(pd.Timestamp.utcnow().floor('D') - pd.DateOffset(days=1))]
-            .sort_values("sentiment_score", ascending=False).iloc[0].to_dict()
-            if (self.news_df["published_date"] >= pd.to_datetime(pd.Timestamp.utcnow().floor('D') - pd.DateOffset(days=1))).any()
-            else self.news_empty_post
-            )
-        news_this_week = (
-            self.news_df[
-                (self.news_df["published_date"] < pd.to_datetime(pd.Timestamp.utcnow().floor('D') - pd.DateOffset(days=1))) & 
-                (self.news_df["published_date"] >= pd.to_datetime(pd.Timestamp.utcnow().floor('D') - pd.DateOffset(days=7)))
-                ].sort_values("sentiment_score", ascending=False).iloc[0].to_dict()
-            if ((self.news_df["published_date"] < pd.to_datetime(pd.Timestamp.utcnow().floor('D') - pd.DateOffset(days=1))) & 
-                (self.news_df["published_date"] >= pd.to_datetime(pd.Timestamp.utcnow().floor('D') - pd.DateOffset(days=7)))).any()
-            else self.news_empty_post
-            )
-        news_this_month = (
-            self.news_df[
-                (self.news_df["published_date"] < pd.to_datetime(pd.Timestamp.utcnow().floor('D') - pd.DateOffset(days=7))) & 
-                (self.news_df["published_date"] >= pd.to_datetime(pd.Timestamp.utcnow().floor('D') - pd.DateOffset(days=30)))
-                ].sort_values("sentiment_score", ascending=False).iloc[0].to_dict()
-            if ((self.news_df["published_date"] < pd.to_datetime(pd.Timestamp.utcnow().floor('D') - pd.DateOffset(days=7))) & 
-                (self.news_df["published_date"] >= pd.to_datetime(pd.Timestamp.utcnow().floor('D') - pd.DateOffset(days=30)))).any()
-            else self.news_empty_post
-            )
+    def get_serve_dash_layout_function(self, asset_id):
+        def serve_asset_dash_layout():
+            return self.serve_dash_layout(asset_id)
+        return serve_asset_dash_layout
+
+    def serve_dash_layout(self, asset_id):
+        layout_cache = self.get_layout_cache(asset_id)
+        encoding = self.get_response_encoding()
+        response = flask.Response(layout_cache["payloads"][encoding], mimetype="application/json")
+        if encoding != "identity":
+            response.headers["Content-Encoding"] = encoding
+        response.headers["Vary"] = "Accept-Encoding"
+        response.set_etag(layout_cache["etag"] if encoding == "identity" else f"{layout_cache['etag']}-{encoding}")
+        response.headers["Cache-Control"] = "no-cache" # Browsers Revalidate, Then Reuse On 304
+        return response.make_conditional(flask.request)
+
+    def get_supported_encodings(self):
+        return ["identity", "gzip"] + (["br"] if brotli is not None else [])
+
+    def get_response_encoding(self):
+        for encoding in ["br", "gzip"]:
+            if encoding in self.get_supported_encodings() and encoding in flask.request.accept_encodings:
+                return encoding
+        return "identity"
+
+    def compress_payload(self, payload, encoding):
+        if encoding == "br":
+            return brotli.compress(payload, quality=9)
+        if encoding == "gzip":
+            return gzip.compress(payload, compresslevel=9, mtime=0)
+        return payload
+
+    def set_response_encoding_and_caching(self, response):
+        request_path = flask.request.path
+
+        # Fingerprinted Assets Never Change Under The Same URL
+        if request_path.startswith(self.assets_url_prefixes) and ("v" in flask.request.args or "m" in flask.request.args):
+            response.headers["Cache-Control"] = "public, max-age=31536000, immutable"
+
+        # Component Suites Are Static, So Each Is Compressed Once Per Encoding
+        if (
+            request_path.startswith(self.component_suites_url_prefixes) 
+            and response.status_code == 200
+            and not response.direct_passthrough
+            and "Content-Encoding" not in response.headers
+            ):
+            encoding = self.get_response_encoding()
+            if encoding != "identity":
+                cache_key = (request_path, encoding)
+                if cache_key not in self.component_suites_cache:
+                    payload = response.get_data()
+                    self.component_suites_cache[cache_key] = (
+                        self.compress_payload(payload, encoding) 
+                        if len(payload) >= self.compression_min_bytes 
+                        else None
+                        )
+                if self.component_suites_cache[cache_key] is not None:
+                    response.set_data(self.component_suites_cache[cache_key])
+                    response.headers["Content-Encoding"] = encoding
+            response.headers["Vary"] = "Accept-Encoding"
+        return response
 
-        # Dashboard Objects
-        dash_objects = {
-            "headline": {
-                "market_cap": statuses_df['market_cap_rank'].iloc[-1],
-                "ath_usd": statuses_df['ath_usd'].iloc[-1],
-                "ath_date": statuses_df['ath_date'].iloc[-1],
-                "atl_usd": statuses_df['atl_usd'].iloc[-1],
-                "atl_date": statuses_df['atl_date'].iloc[-1],
-                "last_updated_timestamp": max(
-                    pd.to_datetime(self.news_df["published_timestamp"], utc=True).max(), 
-                    pd.to_datetime(statuses_df["last_updated_timestamp"], utc=True).max()
+    def get_hashed_asset_url(self, asset_name):
+        # Content-Hashed URLs, So Assets Can Be Cached As Immutable; Every Page Shares The Default Page's URLs
+        if asset_name not in self.asset_hashes:
+            try:
+                with open(os.path.join(self.dashboard.config.assets_folder, asset_name), "rb") as asset_file:
+                    self.asset_hashes[asset_name] = hashlib.sha256(asset_file.read()).hexdigest()[:16]
+            except OSError: # Unreadable Assets Are Served Without A Fingerprint
+                return self.dashboard.get_asset_url(asset_name)
+        return f"{self.dashboard.get_asset_url(asset_name)}?v={self.asset_hashes[asset_name]}"
+
+    def get_asset_icon(self, asset_id):
+        # Icons Are Looked Up As assets/<asset_id>-icon-small.webp; Assets Without One Show Only Their Title
+        icon_name = f"{asset_id}-icon-small.webp"
+        if not os.path.isfile(os.path.join(self.dashboard.config.assets_folder, icon_name)):
+            return []
+        return [html.Img(src=self.get_hashed_asset_url(icon_name), className="ps-3 pe-3 pb-2")]
+
+    def get_asset_links(self, asset_id):
+        # Links Between Asset Pages, Shown Once More Than One Asset Is Tracked; Each Page Is Its Own Dash App
+        if len(self.database_manager.asset_ids) <= 1:
+            return []
+        asset_links = []
+        for link_asset_id in self.database_manager.asset_ids:
+            if len(asset_links) > 0:
+                asset_links.append(html.Span("|", className="ps-3 pe-3"))
+            asset_links.append(
+                html.A(
+                    self.assets_symbols.get(link_asset_id, link_asset_id.upper()),
+                    href=self.get_asset_pathname(link_asset_id),
+                    className="text-white",
+                    style={"fontWeight": "bold" if link_asset_id == asset_id else "normal"}
                     )
-                },
-            "economics": {
-                "prices": fig_prices,
-                "market_caps": fig_market_caps,
-                "total_volumes": fig_total_volumes
-                },
-            "socials": {
-                "github": fig_github,
-                "twitter": fig_twitter
-                },
-            "news": {
-                "today": news_today,
-                "this_week": news_this_week,
-                "this_month": news_this_month
-                }
-            }
-        return dash_objects
+                )
+        return [html.P(asset_links, style={"fontSize": "12pt"})]
+
+    def get_dash_layout_function(self, asset_id):
+        def get_asset_dash_layout():
+            return self.get_dash_layout(asset_id, self.dash_objects.get(asset_id))
+        return get_asset_dash_layout
 
-    def get_dash_layout(self):
+    def get_dash_layout(self, asset_id, dash_objects):
+        if dash_objects is None:
+            return self.get_dash_placeholder_layout(asset_id)
         dash_layout = html.Div(
             [
                 # Header Section
@@ -375,15 +264,16 @@ class DashBoardManager:
                     [
                         html.H1(
                             [
-                                html.Span("The Daily BTC", style={"fontSize": 48}), 
-                                html.Img(src=get_asset_url("bitcoin-icon-small.webp"), className="ps-3 pe-3 pb-2"),
+                                html.Span(self.get_asset_title(asset_id), style={"fontSize": 48}), 
+                                *self.get_asset_icon(asset_id)
                                 ]
                             ),
                         html.P(
                             f"""Last updated on 
-                            {self.dash_objects['headline']['last_updated_timestamp'].strftime("%Y-%m-%d at %I:%M %p %Z.")}""", 
+                            {dash_objects['headline']['last_updated_timestamp'].strftime("%Y-%m-%d at %I:%M %p %Z.")}""", 
                             style={"fontStyle": "italic", "fontSize": "12pt"}
-                            )
+                            ),
+                        *self.get_asset_links(asset_id)
                         ], 
                     className="row ps-4 pe-4 pt-4 pb-1 text-center"
                     ),
@@ -392,13 +282,13 @@ class DashBoardManager:
                     [
                         html.P(
                             [
-                                html.Span(f"MARKET CAP RANK: #{self.dash_objects['headline']['market_cap']}"),
+                                html.Span(f"MARKET CAP RANK: #{dash_objects['headline']['market_cap']}"),
                                 html.Span(f"|", className="ps-3 pe-3"),
-                                html.Span(f"""ALL-TIME HIGH PRICE: ${self.dash_objects['headline']['ath_usd']:,} 
-                                          ON {self.dash_objects['headline']['ath_date']}"""),
+                                html.Span(f"""ALL-TIME HIGH PRICE: ${dash_objects['headline']['ath_usd']:,} 
+                                          ON {dash_objects['headline']['ath_date']}"""),
                                 html.Span(f"|", className="ps-3 pe-3"),
-                                html.Span(f"""ALL-TIME LOW PRICE: ${self.dash_objects['headline']['atl_usd']:,} 
-                                          ON {self.dash_objects['headline']['atl_date']}""")
+                                html.Span(f"""ALL-TIME LOW PRICE: ${dash_objects['headline']['atl_usd']:,} 
+                                          ON {dash_objects['headline']['atl_date']}""")
                                 ]
                             )
                         ], 
@@ -416,7 +306,8 @@ class DashBoardManager:
                                             [
                                                 dcc.Tab(
                                                     dcc.Graph(
-                                                        figure=self.dash_objects["economics"]["prices"], 
+                                                        id="prices-graph",
+                                                        figure=dash_objects["economics"]["prices"], 
                                                         style={"width": "100%"}
                                                         ),
                                                     label='PRICES', 
@@ -429,7 +320,8 @@ class DashBoardManager:
                                                     ),
                                                 dcc.Tab(
                                                     dcc.Graph(
-                                                        figure=self.dash_objects["economics"]["market_caps"], 
+                                                        id="market_caps-graph",
+                                                        figure=dash_objects["economics"]["market_caps"], 
                                                         style={"width": "100%"}
                                                         ),
                                                     label='MARKET CAPS', 
@@ -442,7 +334,8 @@ class DashBoardManager:
                                                     ),
                                                 dcc.Tab(
                                                     dcc.Graph(
-                                                        figure=self.dash_objects["economics"]["total_volumes"], 
+                                                        id="total_volumes-graph",
+                                                        figure=dash_objects["economics"]["total_volumes"], 
                                                         style={"width": "100%"}
                                                         ),
                                                     label='TOTAL VOLUMES', 
@@ -466,7 +359,8 @@ class DashBoardManager:
                                             [
                                                 dcc.Tab(
                                                     dcc.Graph(
-                                                        figure=self.dash_objects["socials"]["github"], 
+                                                        id="github-graph",
+                                                        figure=dash_objects["socials"]["github"], 
                                                         style={"width": "100%"}
                                                         ),
                                                     label='GITHUB', 
@@ -479,7 +373,8 @@ class DashBoardManager:
                                                     ),
                                                 dcc.Tab(
                                                     dcc.Graph(
-                                                        figure=self.dash_objects["socials"]["twitter"], 
+                                                        id="twitter-graph",
+                                                        figure=dash_objects["socials"]["twitter"], 
                                                         style={"width": "100%"}
                                                         ),
                                                     label='TWITTER', 
@@ -515,20 +410,20 @@ class DashBoardManager:
                                                     [
                                                         html.Div(
                                                             html.Img(
-                                                                src=self.dash_objects["news"]["today"]["url_to_image"], 
+                                                                src=dash_objects["news"]["today"]["url_to_image"], 
                                                                 className="mx-auto w-100",
                                                                 ),
                                                             className="d-flex align-items-center"
                                                             ),
                                                         html.A(
-                                                            self.dash_objects["news"]["today"]["title"], 
-                                                            href=self.dash_objects["news"]["today"]["url_to_post"],
+                                                            dash_objects["news"]["today"]["title"], 
+                                                            href=dash_objects["news"]["today"]["url_to_post"],
                                                             target="_blank",
                                                             rel="noopener noreferrer"
                                                             ),
                                                         html.Br(),
                                                         html.Span(
-                                                            self.dash_objects["news"]["today"]["subtitle"], 
+                                                            dash_objects["news"]["today"]["subtitle"], 
                                                             style={"fontStyle": "italic"}
                                                             )
                                                         ]
@@ -553,20 +448,20 @@ class DashBoardManager:
                                                     [
                                                         html.Div(
                                                             html.Img(
-                                                                src=self.dash_objects["news"]["this_week"]["url_to_image"], 
+                                                                src=dash_objects["news"]["this_week"]["url_to_image"], 
                                                                 className="mx-auto w-100",
                                                                 ),
                                                             className="d-flex align-items-center"
                                                             ),
                                                         html.A(
-                                                            self.dash_objects["news"]["this_week"]["title"], 
-                                                            href=self.dash_objects["news"]["this_week"]["url_to_post"],
+                                                            dash_objects["news"]["this_week"]["title"], 
+                                                            href=dash_objects["news"]["this_week"]["url_to_post"],
                                                             target="_blank",
                                                             rel="noopener noreferrer"
                                                             ),
                                                         html.Br(),
                                                         html.Span(
-                                                            self.dash_objects["news"]["this_week"]["subtitle"], 
+                                                            dash_objects["news"]["this_week"]["subtitle"], 
                                                             style={"fontStyle": "italic"}
                                                             )
                                                         ]
@@ -591,20 +486,20 @@ class DashBoardManager:
                                                     [
                                                         html.Div(
                                                             html.Img(
-                                                                src=self.dash_objects["news"]["this_month"]["url_to_image"], 
+                                                                src=dash_objects["news"]["this_month"]["url_to_image"], 
                                                                 className="mx-auto w-100",
                                                                 ),
                                                             className="d-flex align-items-center"
                                                             ),
                                                         html.A(
-                                                            self.dash_objects["news"]["this_month"]["title"], 
-                                                            href=self.dash_objects["news"]["this_month"]["url_to_post"],
+                                                            dash_objects["news"]["this_month"]["title"], 
+                                                            href=dash_objects["news"]["this_month"]["url_to_post"],
                                                             target="_blank",
                                                             rel="noopener noreferrer"
                                                             ),
                                                         html.Br(),
                                                         html.Span(
-                                                            self.dash_objects["news"]["this_month"]["subtitle"], 
+                                                            dash_objects["news"]["this_month"]["subtitle"], 
                                                             style={"fontStyle": "italic"}
                                                             )
                                                         ]
@@ -632,7 +527,7 @@ class DashBoardManager:
                             [
                                 html.A(
                                     html.Img(
-                                        src=get_asset_url("linkedin_icon.png"), 
+                                        src=self.get_hashed_asset_url("linkedin_icon.png"), 
                                         className="p-2", 
                                         style={"width": "8vh"}
                                         ), 
@@ -642,7 +537,7 @@ class DashBoardManager:
                                     ),
                                 html.A(
                                     html.Img(
-                                        src=get_asset_url("github_icon.png"), 
+                                        src=self.get_hashed_asset_url("github_icon.png"), 
                                         className="p-2", 
                                         style={"width": "8vh"}
                                         ),
@@ -661,6 +556,136 @@ class DashBoardManager:
             )
         return dash_layout
 
-    def update_dash_objects(self, data_objects):
-        self.dash_objects = self.get_dash_objects(data_objects)
+    def get_chart_zoom_callback(self, asset_id, chart_name):
+        def update_chart_zoom(relayout_data):
+            return self.get_zoomed_chart_figure(asset_id, chart_name, relayout_data)
+        return update_chart_zoom
+
+    def get_zoomed_chart_figure(self, asset_id, chart_name, relayout_data):
+        relayout_data = relayout_data or {}
+
+        # Zooming Out Restores The Downsampled Figure From The Latest Build
+        if relayout_data.get("xaxis.autorange") and asset_id in self.dash_objects:
+            return self.dash_objects[asset_id][self.chart_manager.charts[chart_name]["section"]][chart_name]
+        if "xaxis.range[0]" not in relayout_data or "xaxis.range[1]" not in relayout_data:
+            return no_update
+
+        # Only The Selected Window Is Read, Then Downsampled Only If It Is Still Too Long
+        chart_df = self.chart_manager.get_chart_df(
+            self.database_manager.read_daily_statuses(
+                asset_id,
+                str(relayout_data["xaxis.range[0]"])[:10],
+                str(relayout_data["xaxis.range[1]"])[:10]
+                )
+            )
+        if len(chart_df) == 0:
+            return no_update
+        return self.chart_manager.get_chart_figure(chart_name, chart_df)
+
+    def get_dash_placeholder_layout(self, asset_id):
+        dash_layout = html.Div(
+            [
+                # Header Section
+                html.Div(
+                    [
+                        html.H1(
+                            [
+                                html.Span(self.get_asset_title(asset_id), style={"fontSize": 48}), 
+                                *self.get_asset_icon(asset_id)
+                                ]
+                            ),
+                        html.P(
+                            "Gathering the latest data. Please refresh the page in a few moments.", 
+                            style={"fontStyle": "italic", "fontSize": "12pt"}
+                            ),
+                        *self.get_asset_links(asset_id)
+                        ], 
+                    className="row ps-4 pe-4 pt-4 pb-4 text-center"
+                    )
+                ], 
+            className="container-fluid bg-dark text-white vh-100"
+            )
+        return dash_layout
+
+    def update_dash_objects(self, insert_counts=None):
+        # Dirty Check: Nothing To Rebuild When Ingest Stored Nothing, Or The Artifacts Cover Every Row
+        if insert_counts is not None:
+            if not any(counts["inserted"] > 0 for counts in insert_counts.values()):
+                return None
+        elif not self.is_snapshot_stale():
+            return None
+
+        # Waiting On The Future Releases The GIL, So Request Threads Stay Responsive; Only Rebuilt Assets Come Back
+        try:
+            updated_dash_objects = self.get_refresh_executor().submit(build_dash_objects, True).result()
+            self.dash_objects = {**self.dash_objects, **updated_dash_objects}
+            for asset_id in updated_dash_objects:
+                self.snapshots_mtimes[asset_id] = self.snapshot_manager.get_snapshot_mtime(asset_id)
+        except BrokenProcessPool:
+            # A Fresh Refresh Process Starts Over With A Full Build On The Next Run
+            self.refresh_executor = None
+            raise
         return None
+
+    def time_response(self, client, path, encoding, etag=None):
+        # Time To The First Body Chunk Through The Full Flask Stack, Then The Rest Of The Body
+        headers = {"Accept-Encoding": encoding}
+        if etag is not None:
+            headers["If-None-Match"] = etag
+        start_time = time.perf_counter()
+        response = client.get(path, headers=headers, buffered=False)
+        body_chunks = response.iter_encoded()
+        first_chunk = next(body_chunks, b"")
+        ttfb_sec = time.perf_counter() - start_time
+        body = first_chunk + b"".join(body_chunks)
+        response.close()
+        return response, body, ttfb_sec
+
+    def benchmark(self, asset_id=None):
+        # Response Sizes And Time To First Byte Per Encoding: Cold, Cached And Revalidated (304 When There Is An ETag)
+        asset_id = self.database_manager.asset_ids[0] if asset_id is None else asset_id
+        pathname = self.get_asset_pathname(asset_id)
+        client = self.dashboard.server.test_client()
+        component_suite_path = re.search(
+            r'src="([^"]*_dash-component-suites/dash/dcc/dash_core_components\.v[^"]*)"',
+            client.get(pathname).get_data(as_text=True)
+            ).group(1)
+        benchmark_results = []
+        for name, path in [("layout", f"{pathname}_dash-layout"), ("component_suite", component_suite_path)]:
+            for encoding in self.get_supported_encodings():
+                # Cold: Nothing Serialized Or Compressed Yet
+                self.layout_caches[asset_id] = {"dash_objects": None, "payloads": None, "etag": None}
+                self.component_suites_cache = {}
+                for case in ["cold", "cached", "304"]:
+                    etag = response.headers.get("ETag") if case == "304" else None
+                    if case == "304" and etag is None:
+                        continue
+                    response, body, ttfb_sec = self.time_response(client, path, encoding, etag)
+                    benchmark_results.append(
+                        {
+                            "name": name,
+                            "case": case,
+                            "encoding": encoding, # Accepted; Bodies Under compression_min_bytes Are Sent As Is
+                            "status_code": response.status_code,
+                            "body_bytes": len(body),
+                            "ttfb_sec": ttfb_sec
+                            }
+                        )
+        return benchmark_results
+
+if __name__ == "__main__":
+    # Response Benchmark Over The Stored Data And Snapshots, Through Flask's Test Client
+    # Usage: python dashboardmanager.py --asset-id ethereum
+    import argparse
+    from databasemanager import DataBaseManager
+    parser = argparse.ArgumentParser(description="Benchmark layout and component suite responses for an asset's page.")
+    parser.add_argument("--asset-id", default=None)
+    arguments = parser.parse_args()
+
+    dashboard_manager = DashBoardManager(flask.Flask(__name__), DataBaseManager())
+    for result in dashboard_manager.benchmark(arguments.asset_id):
+        print(
+            f"{result['name']:>15} {result['case']:>6} encoding={result['encoding']:>8} "
+            f"status={result['status_code']} size={result['body_bytes'] / 1024:,.1f} KB "
+            f"ttfb={result['ttfb_sec'] * 1000:,.2f} ms"
+            )
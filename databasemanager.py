@@ -4,11 +4,18 @@ Purpose: A database manager for The Daily BTC Web Application.
 
 import os
 from dotenv import load_dotenv
-from sqlalchemy import create_engine, ForeignKey, select
+from filelock import FileLock
+from sqlalchemy import create_engine, event, ForeignKey, func, Index, select, UniqueConstraint
+from sqlalchemy.dialects.sqlite import insert
+from sqlalchemy.pool import QueuePool
 from sqlalchemy.orm import DeclarativeBase, Mapped, mapped_column, relationship, Session
 from typing import Optional, List
-import requests
+import json
+import pandas as pd
 import datetime as dt
+from indicatormanager import IndicatorManager
+from fetchmanager import FetchManager
+from schedulemanager import ScheduleManager
 
 load_dotenv()
 
@@ -17,8 +24,10 @@ class Base(DeclarativeBase):
 
 class Statuses(Base):
     __tablename__ = "statuses"
+    __table_args__ = (Index("ix_statuses_asset_id_last_updated_timestamp", "asset_id", "last_updated_timestamp", unique=True),)
 
     id: Mapped[int] = mapped_column(primary_key=True)
+    asset_id: Mapped[str] = mapped_column(server_default="bitcoin") # CoinGecko Coin ID; Older Rows Are Bitcoin's
     block_time_in_minutes: Mapped[Optional[int]]
     market_cap_rank: Mapped[Optional[int]]
     price_usd: Mapped[Optional[float]]
@@ -31,8 +40,8 @@ class Statuses(Base):
     total_volume_usd: Mapped[Optional[int]]
     circulating_supply: Mapped[Optional[int]]
     max_supply: Mapped[Optional[int]]
-    last_updated_timestamp: Mapped[Optional[str]]
-    last_updated_date: Mapped[Optional[str]]
+    last_updated_timestamp: Mapped[Optional[str]] = mapped_column(index=True)
+    last_updated_date: Mapped[Optional[str]] = mapped_column(index=True)
     twitter_followers_count: Mapped[Optional[int]]
     github_total_issues_count: Mapped[Optional[int]]
     github_closed_issues_count: Mapped[Optional[int]]
@@ -52,166 +61,754 @@ class News(Base):
     url_to_post: Mapped[str] = mapped_column(unique=True)
     url_to_image: Mapped[Optional[str]]
     published_timestamp: Mapped[Optional[str]]
-    published_date: Mapped[Optional[str]] = mapped_column(ForeignKey("statuses.last_updated_date"))
+    published_date: Mapped[Optional[str]] = mapped_column(ForeignKey("statuses.last_updated_date"), index=True)
     
     last_updated_date_rel: Mapped[Statuses] = relationship(back_populates="news_ids_rel")
 
+class NewsAssets(Base):
+    __tablename__ = "news_assets"
+    __table_args__ = (UniqueConstraint("news_id", "asset_id"),)
+
+    # One Row Per Article Per Asset It Covers, So Articles And Their Sentiments Are Stored Once
+    id: Mapped[int] = mapped_column(primary_key=True)
+    news_id: Mapped[int] = mapped_column(ForeignKey("news.id"))
+    asset_id: Mapped[str] = mapped_column(index=True)
+
+class Sentiments(Base):
+    __tablename__ = "sentiments"
+    __table_args__ = (UniqueConstraint("news_id", "model_name"),)
+
+    id: Mapped[int] = mapped_column(primary_key=True)
+    news_id: Mapped[int] = mapped_column(ForeignKey("news.id"))
+    content_hash: Mapped[str] # SHA-256 Of The Text Scored, To Detect Edited Articles
+    model_name: Mapped[str]
+    model_version: Mapped[Optional[str]]
+    sentiment_label: Mapped[Optional[str]]
+    sentiment_score: Mapped[Optional[float]]
+
+class DailyStatuses(Base):
+    __tablename__ = "daily_statuses"
+
+    # One Row Per Asset Per Day: Running Sums And Counts For Daily Means, Running Maxes For Daily Totals
+    asset_id: Mapped[str] = mapped_column(primary_key=True)
+    last_updated_date: Mapped[str] = mapped_column(primary_key=True)
+    samples_count: Mapped[int]
+    price_usd_sum: Mapped[Optional[float]]
+    price_usd_count: Mapped[int]
+    market_cap_usd_sum: Mapped[Optional[float]]
+    market_cap_usd_count: Mapped[int]
+    fully_diluted_valuation_usd_sum: Mapped[Optional[float]]
+    fully_diluted_valuation_usd_count: Mapped[int]
+    total_volume_usd_sum: Mapped[Optional[float]]
+    total_volume_usd_count: Mapped[int]
+    twitter_followers_count_max: Mapped[Optional[int]]
+    github_total_issues_count_max: Mapped[Optional[int]]
+    github_closed_issues_count_max: Mapped[Optional[int]]
+    github_pull_requests_merged_count_max: Mapped[Optional[int]]
+    github_pull_request_contributors_count_max: Mapped[Optional[int]]
+
+class DailyIndicators(Base):
+    __tablename__ = "daily_indicators"
+
+    # One Row Per Asset Per Indicator Per Day, With The State Needed To Advance To The Next Day
+    asset_id: Mapped[str] = mapped_column(primary_key=True)
+    indicator_name: Mapped[str] = mapped_column(primary_key=True)
+    last_updated_date: Mapped[str] = mapped_column(primary_key=True)
+    value: Mapped[Optional[float]]
+    state: Mapped[Optional[str]] # JSON
+
+# Rebuilds The Daily Rollup From Every Status Row; Each Column Aggregates Its Non-Null Values
+DAILY_STATUSES_REBUILD_SQL = [
+    "DELETE FROM daily_statuses",
+    """INSERT INTO daily_statuses (
+        asset_id, last_updated_date, samples_count,
+        price_usd_sum, price_usd_count, market_cap_usd_sum, market_cap_usd_count,
+        fully_diluted_valuation_usd_sum, fully_diluted_valuation_usd_count, total_volume_usd_sum, total_volume_usd_count,
+        twitter_followers_count_max, github_total_issues_count_max, github_closed_issues_count_max,
+        github_pull_requests_merged_count_max, github_pull_request_contributors_count_max
+        )
+    SELECT
+        asset_id, last_updated_date, COUNT(*),
+        SUM(price_usd), COUNT(price_usd), SUM(market_cap_usd), COUNT(market_cap_usd),
+        SUM(fully_diluted_valuation_usd), COUNT(fully_diluted_valuation_usd), SUM(total_volume_usd), COUNT(total_volume_usd),
+        MAX(twitter_followers_count), MAX(github_total_issues_count), MAX(github_closed_issues_count),
+        MAX(github_pull_requests_merged_count), MAX(github_pull_request_contributors_count)
+    FROM statuses
+    WHERE last_updated_date IS NOT NULL
+    GROUP BY asset_id, last_updated_date"""
+    ]
+
+# Schema Migrations: Applied In Order To Existing Databases, Tracked By SQLite's user_version
+SCHEMA_MIGRATIONS = [
+    [ # Version 1: Secondary Indexes For Hot Query Columns
+        "CREATE INDEX IF NOT EXISTS ix_statuses_last_updated_timestamp ON statuses (last_updated_timestamp)",
+        "CREATE INDEX IF NOT EXISTS ix_statuses_last_updated_date ON statuses (last_updated_date)",
+        "CREATE INDEX IF NOT EXISTS ix_news_published_date ON news (published_date)"
+        ],
+    [ # Version 2: Statuses, News And Daily Tables Keyed By Asset; Existing Rows Are Bitcoin's
+        lambda database_manager, connection: database_manager.add_missing_column(
+            connection, "statuses", "asset_id VARCHAR DEFAULT 'bitcoin' NOT NULL"
+            ),
+        "CREATE INDEX IF NOT EXISTS ix_statuses_asset_id_last_updated_timestamp ON statuses (asset_id, last_updated_timestamp)",
+        "INSERT OR IGNORE INTO news_assets (news_id, asset_id) SELECT id, 'bitcoin' FROM news",
+        "DROP TABLE IF EXISTS daily_statuses",
+        "DROP TABLE IF EXISTS daily_indicators",
+        lambda database_manager, connection: Base.metadata.create_all(
+            connection,
+            tables=[DailyStatuses.__table__, DailyIndicators.__table__]
+            ),
+        *DAILY_STATUSES_REBUILD_SQL,
+        lambda database_manager, connection: database_manager.update_daily_indicators(connection)
+        ],
+    [ # Version 3: One Status Per Asset Per Timestamp, Keeping The First Stored; Daily Tables Rebuilt Without Duplicates
+        """DELETE FROM statuses WHERE last_updated_timestamp IS NOT NULL AND id NOT IN (
+            SELECT MIN(id) FROM statuses GROUP BY asset_id, last_updated_timestamp
+            )""",
+        "DROP INDEX IF EXISTS ix_statuses_asset_id_last_updated_timestamp",
+        "CREATE UNIQUE INDEX ix_statuses_asset_id_last_updated_timestamp ON statuses (asset_id, last_updated_timestamp)",
+        *DAILY_STATUSES_REBUILD_SQL,
+        lambda database_manager, connection: database_manager.update_daily_indicators(connection)
+        ]
+    ]
+
 class DataBaseManager:
     def __init__(self):
         # Parameters
-        self.crypto_id = "bitcoin"
-        self.update_database_rate_sec = 60 * 60 * 8 # 8-Hour Delays Between API Calls
+        self.asset_ids = [ # CoinGecko Coin IDs; The First Is The Dashboard's Default Page
+            asset_id.strip() for asset_id in os.getenv("ASSET_IDS", "bitcoin").split(",") if asset_id.strip() != ""
+            ]
+        self.assets_news_terms = {asset_id: asset_id.replace("-", " ") for asset_id in self.asset_ids}
         self.db_path = os.getenv("DB_PATH")
+        self.high_water_marks = {"statuses": 0, "news": 0} # Max IDs Already Read Per Table (news_assets For News)
+        self.assets_high_water_marks = {} # Asset ID: Max IDs Read For That Asset, To Snapshot Each Asset On Its Own
+        self.db_pragmas = { # Applied To Every New Connection, In Order
+            "busy_timeout": int(os.getenv("DB_BUSY_TIMEOUT_MS", 30000)), # Wait On Locks Instead Of Failing
+            "journal_mode": os.getenv("DB_JOURNAL_MODE", "WAL"), # Readers Never Block On The Writer
+            "synchronous": os.getenv("DB_SYNCHRONOUS", "NORMAL"), # Safe Under WAL With Fewer fsyncs
+            "mmap_size": int(os.getenv("DB_MMAP_SIZE_BYTES", 256 * 1024 * 1024)),
+            "cache_size": int(os.getenv("DB_CACHE_SIZE", -64 * 1024)) # Negative Values Are In KiB
+            }
+        self.db_pool_size = int(os.getenv("DB_POOL_SIZE", 5)) # Pooled Connections Per Process
+        self.db_pool_max_overflow = int(os.getenv("DB_POOL_MAX_OVERFLOW", 10))
+        self.db_max_variables = 900 # Max Bound Parameters Per IN Clause For Older SQLite Builds
+        self.daily_rollup_columns = { # Status Column: Daily Aggregate Kept In daily_statuses
+            "price_usd": "sum",
+            "market_cap_usd": "sum",
+            "fully_diluted_valuation_usd": "sum",
+            "total_volume_usd": "sum",
+            "twitter_followers_count": "max",
+            "github_total_issues_count": "max",
+            "github_closed_issues_count": "max",
+            "github_pull_requests_merged_count": "max",
+            "github_pull_request_contributors_count": "max"
+            }
+        self.indicator_manager = IndicatorManager()
+        self.headline_columns = [ # Columns A Status Needs To Headline An Asset's Page; Charts Skip Missing Values Per Day
+            "market_cap_rank", "ath_usd", "ath_date", "atl_usd", "atl_date", "last_updated_timestamp"
+            ]
+        self.dashboard_columns = { # Columns Used By The Dashboard, For Columnar Reads
+            "statuses": [
+                "id", "asset_id", "market_cap_rank", "ath_usd", "ath_date", "atl_usd", "atl_date",
+                "last_updated_timestamp", "last_updated_date",
+                "price_usd", "market_cap_usd", "fully_diluted_valuation_usd", "total_volume_usd",
+                "twitter_followers_count", "github_total_issues_count", "github_closed_issues_count",
+                "github_pull_requests_merged_count", "github_pull_request_contributors_count"
+                ],
+            "news": [
+                "id", "source_name", "author", "title", "description", 
+                "url_to_post", "url_to_image", "published_timestamp", "published_date"
+                ]
+            }
         self.create_database()
 
         # CoinGecko API
         ### General Data Endpoint: https://docs.coingecko.com/v3.0.1/reference/coins-id
         self.coingecko_api_key = os.getenv("COINGECKO_API_KEY")
-        self.coingecko_api_endpoint = f"https://api.coingecko.com/api/v3/coins/{self.crypto_id}"
+        self.coingecko_api_endpoint = "https://api.coingecko.com/api/v3/coins/{asset_id}" # One Request Per Asset
 
         # News API
         ### Everything Endpoint: https://newsapi.org/docs/endpoints/everything
         self.news_api_key = os.getenv("NEWS_API_KEY")
         self.news_api_endpoint = "https://newsapi.org/v2/everything"
+
+        # Fetching: Pooled Keep-Alive Session, Timeouts, Retries And Rate Limits Shared By Both APIs And Every Asset
+        self.fetch_manager = FetchManager()
+        self.update_listeners = [] # Called With The Insert Counts After Each Ingest
+
+        # Sources: Each API's Rows And Table, Polled Together Or On Their Own Adaptive Cadences
+        self.sources = {
+            "coingecko": {"table": "statuses", "get_rows": self.get_statuses_rows, "insert": self.insert_statuses},
+            "news": {"table": "news", "get_rows": self.get_news_rows, "insert": self.insert_news}
+            }
+        self.schedule_manager = ScheduleManager({"coingecko": len(self.asset_ids)}) # One CoinGecko Request Per Asset
         return None
 
     def create_database(self):
-        self.engine = create_engine(f"sqlite:///{self.db_path}")
-        Base.metadata.create_all(self.engine)
+        self.engine = create_engine(
+            f"sqlite:///{self.db_path}",
+            poolclass=QueuePool,
+            pool_size=self.db_pool_size,
+            max_overflow=self.db_pool_max_overflow,
+            connect_args={
+                "timeout": self.db_pragmas["busy_timeout"] / 1000, 
+                "check_same_thread": False
+                }
+            )
+        event.listen(self.engine, "connect", self.set_database_pragmas)
+
+        # Every Worker Creates And Migrates At Import, So One At A Time; Later Ones Find The Schema Up To Date
+        with FileLock(f"{self.db_path}.schema.lock"):
+            Base.metadata.create_all(self.engine)
+            self.migrate_database()
         return None
 
-    def read_database(self):
-        with Session(self.engine) as session:
+    def set_database_pragmas(self, dbapi_connection, connection_record):
+        cursor = dbapi_connection.cursor()
+        for pragma_name, pragma_value in self.db_pragmas.items():
+            cursor.execute(f"PRAGMA {pragma_name} = {pragma_value}")
+        cursor.close()
+        return None
+
+    def add_missing_column(self, connection, table_name, column_definition):
+        # New Databases Already Have The Column From create_all
+        column_names = [row[1] for row in connection.exec_driver_sql(f"PRAGMA table_info({table_name})")]
+        if column_definition.split()[0] not in column_names:
+            connection.exec_driver_sql(f"ALTER TABLE {table_name} ADD COLUMN {column_definition}")
+        return None
+
+    def migrate_database(self):
+        # Tables Already Exist For Deployed Databases, So Upgrade Them In Place
+        # The Version Is Read Under The Schema Lock, So A Migration Never Runs Twice
+        with self.engine.begin() as connection:
+            schema_version = connection.exec_driver_sql("PRAGMA user_version").scalar()
+            for version in range(schema_version, len(SCHEMA_MIGRATIONS)):
+                for statement in SCHEMA_MIGRATIONS[version]:
+                    if callable(statement): # Steps That Need Python, Such As Recomputing Indicators
+                        statement(self, connection)
+                    else:
+                        connection.exec_driver_sql(statement)
+                connection.exec_driver_sql(f"PRAGMA user_version = {version + 1}")
+        return None
+
+    def read_database_frames(self, incremental=False, news_start_date=None):
+        # Full Reloads Start Over From The Beginning Of Each Table; Older News Is Skipped When A Start Date Is Given
+        if not incremental:
+            self.high_water_marks = {"statuses": 0, "news": 0}
+            self.assets_high_water_marks = {asset_id: {"statuses": 0, "news": 0} for asset_id in self.asset_ids}
+
+        # Core Selects Straight Into Columns, Skipping ORM Objects And Row Dicts
+        with self.engine.connect() as connection:
             # STATUSES TABLE
-            statuses_rows_list = []
-            session.commit()
-            statuses_query_results = session.scalars(select(Statuses)).all()
-            for result in statuses_query_results:
-                statuses_row = {
-                    "id": result.id,
-                    "block_time_in_minutes": result.block_time_in_minutes,
-                    "price_usd": result.price_usd,
-                    "ath_usd": result.ath_usd,
-                    "ath_date": result.ath_date,
-                    "atl_usd": result.atl_usd,
-                    "atl_date": result.atl_date,
-                    "market_cap_usd": result.market_cap_usd,
-                    "fully_diluted_valuation_usd": result.fully_diluted_valuation_usd,
-                    "market_cap_rank": result.market_cap_rank,
-                    "total_volume_usd": result.total_volume_usd,
-                    "max_supply": result.max_supply,
-                    "circulating_supply": result.circulating_supply,
-                    "last_updated_timestamp": result.last_updated_timestamp,
-                    "last_updated_date": result.last_updated_date,
-                    "twitter_followers_count": result.twitter_followers_count,
-                    "github_total_issues_count": result.github_total_issues_count,
-                    "github_closed_issues_count": result.github_closed_issues_count,
-                    "github_pull_requests_merged_count": result.github_pull_requests_merged_count,
-                    "github_pull_request_contributors_count": result.github_pull_request_contributors_count
-                    }
-                statuses_rows_list.append(statuses_row)
-
-            # NEWS TABLE
-            news_rows_list = []
-            session.commit()
-            news_query_results = session.scalars(select(News)).all()
-            for result in news_query_results:
-                news_row = {
-                    "id": result.id,
-                    "source_name": result.source_name,
-                    "author": result.author,
-                    "title": result.title,
-                    "description": result.description,
-                    "url_to_post": result.url_to_post,
-                    "url_to_image": result.url_to_image,
-                    "published_timestamp": result.published_timestamp,
-                    "published_date": result.published_date
-                    }
-                news_rows_list.append(news_row)
+            statuses_columns = [Statuses.__table__.c[column] for column in self.dashboard_columns["statuses"]]
+            if incremental:
+                statuses_df = pd.read_sql(
+                    select(*statuses_columns)
+                    .where(Statuses.id > self.high_water_marks["statuses"], Statuses.asset_id.in_(self.asset_ids))
+                    .order_by(Statuses.id),
+                    connection
+                    )
+                statuses_max_ids = statuses_df.groupby("asset_id")["id"].max().to_dict()
+            else:
+                # Max IDs First, So Rows Inserted During The Reload Are Read Next Time
+                statuses_max_ids = dict(
+                    connection.execute(
+                        select(Statuses.asset_id, func.max(Statuses.id)).group_by(Statuses.asset_id)
+                        ).all()
+                    )
+
+                # Full Reloads Only Need Each Asset's Newest Status With Its Headline; Daily History Comes From The Rollup
+                statuses_dfs_list = [
+                    pd.read_sql(
+                        select(*statuses_columns)
+                        .where(
+                            Statuses.asset_id == asset_id,
+                            *[Statuses.__table__.c[column].is_not(None) for column in self.headline_columns]
+                            )
+                        .order_by(Statuses.id.desc())
+                        .limit(1),
+                        connection
+                        )
+                    for asset_id in self.asset_ids
+                    ]
+                statuses_df = pd.concat( # Assets Without A Headline Status Yet Are Skipped, Keeping The Columns
+                    [asset_statuses_df for asset_statuses_df in statuses_dfs_list if len(asset_statuses_df) > 0]
+                    or statuses_dfs_list[:1],
+                    ignore_index=True
+                    )
+
+            # NEWS TABLE: One Row Per Article Per Asset, Read By news_assets ID
+            # Max IDs First, So Skipped Older Articles Still Advance The High-Water Marks
+            news_max_ids = dict(
+                connection.execute(
+                    select(NewsAssets.asset_id, func.max(NewsAssets.id))
+                    .where(NewsAssets.id > self.high_water_marks["news"], NewsAssets.asset_id.in_(self.asset_ids))
+                    .group_by(NewsAssets.asset_id)
+                    ).all()
+                )
+            news_df = pd.read_sql(
+                select(
+                    *[News.__table__.c[column] for column in self.dashboard_columns["news"]],
+                    NewsAssets.asset_id,
+                    NewsAssets.id.label("news_asset_id")
+                    )
+                .join(NewsAssets, NewsAssets.news_id == News.id)
+                .where(
+                    NewsAssets.id > self.high_water_marks["news"],
+                    NewsAssets.id <= max(news_max_ids.values(), default=self.high_water_marks["news"]),
+                    NewsAssets.asset_id.in_(self.asset_ids),
+                    *([News.published_date >= news_start_date] if news_start_date is not None else [])
+                    )
+                .order_by(NewsAssets.id),
+                connection
+                )
+
+        # DAILY STATUSES AND INDICATORS TABLES: Only Read For Assets Whose Statuses Changed
+        changed_asset_ids = set(statuses_df["asset_id"]) if incremental else set(self.asset_ids)
+        daily_statuses = {
+            asset_id: self.read_daily_statuses(asset_id) if asset_id in changed_asset_ids else None
+            for asset_id in self.asset_ids
+            }
+
+        # HIGH-WATER MARKS
+        for table_name, max_ids in [("statuses", statuses_max_ids), ("news", news_max_ids)]:
+            for asset_id, max_id in max_ids.items():
+                if asset_id in self.assets_high_water_marks:
+                    self.assets_high_water_marks[asset_id][table_name] = int(max_id)
+                self.high_water_marks[table_name] = max(self.high_water_marks[table_name], int(max_id))
 
         # DATA OBJECTS
         data_objects = {
-            'statuses': statuses_rows_list,
-            'news': news_rows_list
+            'incremental': incremental,
+            'asset_ids': self.asset_ids,
+            'statuses': statuses_df,
+            'daily_statuses': daily_statuses,
+            'news': news_df
             }
         return data_objects
 
-    def update_database(self):
-        # CoinGecko API
-        response_coingecko = requests.get(
-            url=self.coingecko_api_endpoint, 
-            headers={
-                "accept": "application/json", 
-                "x-cg-demo-api-key": self.coingecko_api_key
-                }
+    def read_daily_statuses(self, asset_id, start_date=None, end_date=None):
+        # An Asset's Daily Rollup With Its Indicators, Optionally Limited To An Inclusive Date Window
+        daily_statuses_query = self.get_daily_statuses_query(asset_id)
+        daily_indicators_query = select(
+            DailyIndicators.last_updated_date, 
+            DailyIndicators.indicator_name, 
+            DailyIndicators.value
+            ).where(DailyIndicators.asset_id == asset_id)
+        if start_date is not None:
+            daily_statuses_query = daily_statuses_query.where(DailyStatuses.last_updated_date >= start_date)
+            daily_indicators_query = daily_indicators_query.where(DailyIndicators.last_updated_date >= start_date)
+        if end_date is not None:
+            daily_statuses_query = daily_statuses_query.where(DailyStatuses.last_updated_date <= end_date)
+            daily_indicators_query = daily_indicators_query.where(DailyIndicators.last_updated_date <= end_date)
+        with self.engine.connect() as connection:
+            daily_statuses_df = pd.read_sql(daily_statuses_query, connection)
+            daily_indicators_df = pd.read_sql(daily_indicators_query, connection)
+        daily_statuses_df = daily_statuses_df.merge(
+            daily_indicators_df.pivot(index="last_updated_date", columns="indicator_name", values="value")
+            .reindex(columns=[indicator.name for indicator in self.indicator_manager.indicators])
+            .reset_index(),
+            how="left",
+            on="last_updated_date"
             )
-        response_coingecko.raise_for_status()
-        coingecko_data = response_coingecko.json()
-
-        entry_status = Statuses(
-            block_time_in_minutes=coingecko_data["block_time_in_minutes"],
-            price_usd=coingecko_data["market_data"]["current_price"]["usd"],
-            ath_usd=coingecko_data["market_data"]["ath"]["usd"],
-            ath_date=coingecko_data["market_data"]["ath_date"]["usd"].split("T")[0],
-            atl_usd=coingecko_data["market_data"]["atl"]["usd"],
-            atl_date=coingecko_data["market_data"]["atl_date"]["usd"].split("T")[0],
-            market_cap_usd=coingecko_data["market_data"]["market_cap"]["usd"],
-            fully_diluted_valuation_usd=coingecko_data["market_data"]["fully_diluted_valuation"]["usd"],
-            market_cap_rank=coingecko_data["market_data"]["market_cap_rank"],
-            total_volume_usd=coingecko_data["market_data"]["total_volume"]["usd"],
-            max_supply=coingecko_data["market_data"]["max_supply"],
-            circulating_supply=coingecko_data["market_data"]["circulating_supply"],
-            last_updated_timestamp=coingecko_data["market_data"]["last_updated"],
-            last_updated_date=coingecko_data["market_data"]["last_updated"].split("T")[0],
-            twitter_followers_count=coingecko_data["community_data"]["twitter_followers"],
-            github_total_issues_count=coingecko_data["developer_data"]["total_issues"],
-            github_closed_issues_count=coingecko_data["developer_data"]["closed_issues"],
-            github_pull_requests_merged_count=coingecko_data["developer_data"]["pull_requests_merged"],
-            github_pull_request_contributors_count=coingecko_data["developer_data"]["pull_request_contributors"]
-        )
+        return daily_statuses_df
 
+    def read_high_water_marks(self):
+        # Current Max IDs Per Asset Per Table, To Detect Stale Snapshots
         with Session(self.engine) as session:
-            session.commit()
-            results = session.scalars(select(Statuses)
-                                      .where(Statuses.last_updated_timestamp == entry_status.last_updated_timestamp)).all()
-            if len(results) == 0:
-                session.add(entry_status)
-                session.commit()
+            statuses_max_ids = dict(
+                session.execute(select(Statuses.asset_id, func.max(Statuses.id)).group_by(Statuses.asset_id)).all()
+                )
+            news_max_ids = dict(
+                session.execute(select(NewsAssets.asset_id, func.max(NewsAssets.id)).group_by(NewsAssets.asset_id)).all()
+                )
+        high_water_marks = {
+            asset_id: {
+                "statuses": statuses_max_ids.get(asset_id, 0),
+                "news": news_max_ids.get(asset_id, 0)
+                }
+            for asset_id in self.asset_ids
+            }
+        return high_water_marks
 
-        # News API
-        response_news = requests.get(
-            url=self.news_api_endpoint, 
-            params={
-                "q": self.crypto_id,
+    def read_sentiments(self, news_ids_list, model_name):
+        sentiments_df_list = []
+        with self.engine.connect() as connection:
+            for i in range(0, len(news_ids_list), self.db_max_variables):
+                sentiments_df_list.append(
+                    pd.read_sql(
+                        select(
+                            Sentiments.news_id, Sentiments.content_hash, 
+                            Sentiments.sentiment_label, Sentiments.sentiment_score
+                            )
+                        .where(
+                            Sentiments.model_name == model_name, 
+                            Sentiments.news_id.in_(news_ids_list[i:i + self.db_max_variables])
+                            ),
+                        connection
+                        )
+                    )
+        if len(sentiments_df_list) == 0:
+            return pd.DataFrame(columns=["news_id", "content_hash", "sentiment_label", "sentiment_score"])
+        return pd.concat(sentiments_df_list, ignore_index=True)
+
+    def write_sentiments(self, sentiments_rows_list):
+        # Re-Scored Articles Replace The Cached Result For The Same Model
+        if len(sentiments_rows_list) == 0:
+            return None
+        statement = insert(Sentiments.__table__)
+        with Session(self.engine) as session, session.begin():
+            session.execute(
+                statement.on_conflict_do_update(
+                    index_elements=["news_id", "model_name"],
+                    set_={
+                        "content_hash": statement.excluded.content_hash,
+                        "model_version": statement.excluded.model_version,
+                        "sentiment_label": statement.excluded.sentiment_label,
+                        "sentiment_score": statement.excluded.sentiment_score
+                        }
+                    ),
+                sentiments_rows_list
+                )
+        return None
+
+    def add_update_listener(self, update_listener):
+        self.update_listeners.append(update_listener)
+        return None
+
+    def get_fetch_requests(self, sources_list=None):
+        # Keyed By (Source, Request Key): CoinGecko Fans Out Per Asset, News API Covers Every Asset In One Query
+        fetch_requests = {
+            ("coingecko", asset_id): {
+                "source_name": "coingecko",
+                "url": self.coingecko_api_endpoint.format(asset_id=asset_id),
+                "headers": {
+                    "accept": "application/json", 
+                    "x-cg-demo-api-key": self.coingecko_api_key
+                    }
+                }
+            for asset_id in self.asset_ids
+            }
+        fetch_requests[("news", None)] = { # One Request Per Poll, However Many Assets, Within The Free Plan's Daily Quota
+            "source_name": "news",
+            "url": self.news_api_endpoint,
+            "params": {
+                "q": " OR ".join(
+                    f'"{news_term}"' if " " in news_term else news_term
+                    for news_term in self.assets_news_terms.values()
+                    ),
                 "searchIn": "title,description",
                 "language": "en",
                 "from": (dt.datetime.now() - dt.timedelta(1)).strftime("%Y-%m-%d") + "T00:00:00",
                 "to": dt.datetime.now().strftime("%Y-%m-%d") + "T00:00:00"
                 },
-            headers={
-                "accept": "application/json", 
+            "headers": {
+                "accept": "application/json",
                 "X-Api-Key": self.news_api_key
                 }
+            }
+        return {
+            fetch_key: fetch_request for fetch_key, fetch_request in fetch_requests.items()
+            if sources_list is None or fetch_key[0] in sources_list
+            }
+
+    def get_statuses_rows(self, coingecko_data):
+        statuses_rows_list = [
+            {
+                "asset_id": coingecko_data["id"],
+                "block_time_in_minutes": coingecko_data["block_time_in_minutes"],
+                "price_usd": coingecko_data["market_data"]["current_price"]["usd"],
+                "ath_usd": coingecko_data["market_data"]["ath"]["usd"],
+                "ath_date": coingecko_data["market_data"]["ath_date"]["usd"].split("T")[0],
+                "atl_usd": coingecko_data["market_data"]["atl"]["usd"],
+                "atl_date": coingecko_data["market_data"]["atl_date"]["usd"].split("T")[0],
+                "market_cap_usd": coingecko_data["market_data"]["market_cap"]["usd"],
+                "fully_diluted_valuation_usd": coingecko_data["market_data"]["fully_diluted_valuation"]["usd"],
+                "market_cap_rank": coingecko_data["market_data"]["market_cap_rank"],
+                "total_volume_usd": coingecko_data["market_data"]["total_volume"]["usd"],
+                "max_supply": coingecko_data["market_data"]["max_supply"],
+                "circulating_supply": coingecko_data["market_data"]["circulating_supply"],
+                "last_updated_timestamp": coingecko_data["market_data"]["last_updated"],
+                "last_updated_date": coingecko_data["market_data"]["last_updated"].split("T")[0],
+                "twitter_followers_count": coingecko_data["community_data"]["twitter_followers"],
+                "github_total_issues_count": coingecko_data["developer_data"]["total_issues"],
+                "github_closed_issues_count": coingecko_data["developer_data"]["closed_issues"],
+                "github_pull_requests_merged_count": coingecko_data["developer_data"]["pull_requests_merged"],
+                "github_pull_request_contributors_count": coingecko_data["developer_data"]["pull_request_contributors"]
+                }
+            ]
+        return statuses_rows_list
+
+    def get_news_rows(self, news_response_data):
+        news_data = news_response_data["articles"]
+        news_rows_list = [
+            {
+                "source_name": news["source"]["name"],
+                "author": news["author"],
+                "title": news["title"],
+                "description": news["description"],
+                "url_to_post": news["url"],
+                "url_to_image": news["urlToImage"],
+                "published_timestamp": news["publishedAt"],
+                "published_date": news["publishedAt"].split("T")[0],
+                "asset_ids": self.get_news_asset_ids(news)
+                }
+            for news in news_data
+            ]
+        return news_rows_list
+
+    def get_news_asset_ids(self, news):
+        # Assets Named In The Title Or Description; Articles Matched Only By The API's Own Rules Go To Every Asset
+        news_text = f"{news['title']} {news['description']}".lower()
+        asset_ids = [asset_id for asset_id, news_term in self.assets_news_terms.items() if news_term in news_text]
+        return asset_ids if len(asset_ids) > 0 else list(self.asset_ids)
+
+    def update_database(self, sources_list=None):
+        # Requests Fetched Concurrently, Conditionally When The Last Response Left A Validator
+        fetch_results = self.fetch_manager.fetch_all(
+            {
+                fetch_key: {
+                    **fetch_request,
+                    "headers": {
+                        **fetch_request["headers"],
+                        **self.schedule_manager.get_conditional_headers(*fetch_key)
+                        }
+                    }
+                for fetch_key, fetch_request in self.get_fetch_requests(sources_list).items()
+                }
             )
-        response_news.raise_for_status()
-        news_data = response_news.json()["articles"]
 
-        with Session(self.engine) as session:
-            for news in news_data:
-                entry_news = News(
-                    source_name=news["source"]["name"],
-                    author=news["author"],
-                    title=news["title"],
-                    description=news["description"],
-                    url_to_post=news["url"],
-                    url_to_image=news["urlToImage"],
-                    published_timestamp=news["publishedAt"],
-                    published_date=news["publishedAt"].split("T")[0]
+        # Each Source's Rows, Across Every Asset, Are Stored In Their Own Transaction
+        insert_counts = {}
+        for source_name in sources_list or list(self.sources):
+            source = self.sources[source_name]
+            source_results = {
+                request_key: fetch_result
+                for (fetch_source_name, request_key), fetch_result in fetch_results.items()
+                if fetch_source_name == source_name
+                }
+            rows_list = []
+            for request_key, fetch_result in source_results.items():
+                if not isinstance(fetch_result, Exception) and fetch_result.status_code != 304: # 304: Unchanged Upstream
+                    try:
+                        rows_list.extend(source["get_rows"](fetch_result.json()))
+                    except (ValueError, KeyError, TypeError, AttributeError) as exception:
+                        # Unreadable Bodies Fail Only Their Own Request, Without Keeping Its Validators
+                        source_results[request_key] = fetch_results[(source_name, request_key)] = exception
+            with Session(self.engine) as session, session.begin():
+                inserted_count = source["insert"](session, rows_list)
+            insert_counts[source["table"]] = {
+                "inserted": inserted_count, 
+                "skipped": len(rows_list) - inserted_count
+                }
+            self.schedule_manager.record_response(
+                source_name,
+                {
+                    request_key: getattr(fetch_result, "response", None) if isinstance(fetch_result, Exception) else fetch_result
+                    for request_key, fetch_result in source_results.items()
+                    },
+                None if any(isinstance(fetch_result, Exception) for fetch_result in source_results.values()) else inserted_count
                 )
-                session.commit()
-                results = session.scalars(select(News)
-                                          .where(News.url_to_post == entry_news.url_to_post)).all()
-                if len(results) == 0:
-                    session.add(entry_news)
-                    session.commit()
+
+        # New Data Event: Listeners Get The Insert Counts Of Whatever Was Stored
+        for update_listener in self.update_listeners:
+            update_listener(insert_counts)
+
+        # Failed Requests Are Raised Once The Others Are Stored
+        for fetch_result in fetch_results.values():
+            if isinstance(fetch_result, Exception):
+                raise fetch_result
+        return insert_counts
+
+    def insert_statuses(self, session, statuses_rows_list):
+        # (Asset, Timestamp) Pairs Already Stored Or Repeated Within The Batch Are Skipped By The Unique Index,
+        # So Concurrent Writers Cannot Both Insert The Same Status
+        if len(statuses_rows_list) == 0:
+            return 0
+        statuses_columns = Statuses.__table__.c
+        inserted_keys = set(
+            tuple(result)
+            for result in session.execute(
+                insert(Statuses.__table__)
+                .on_conflict_do_nothing(index_elements=["asset_id", "last_updated_timestamp"])
+                .returning(statuses_columns.asset_id, statuses_columns.last_updated_timestamp),
+                statuses_rows_list
+                ).all()
+            )
+        new_rows_list = []
+        for row in statuses_rows_list:
+            if (row["asset_id"], row["last_updated_timestamp"]) in inserted_keys:
+                inserted_keys.discard((row["asset_id"], row["last_updated_timestamp"])) # First Of Any Repeats Was Stored
+                new_rows_list.append(row)
+        if len(new_rows_list) == 0:
+            return 0
+        self.update_daily_statuses(session, new_rows_list)
+        return len(new_rows_list)
+
+    def update_daily_statuses(self, session, statuses_rows_list):
+        # Folds New Status Rows Into Their Day's Running Sums, Counts And Maxes; Missing Values Are Skipped
+        daily_rows_list = []
+        for row in statuses_rows_list:
+            if row["last_updated_date"] is None:
+                continue
+            daily_row = {"asset_id": row["asset_id"], "last_updated_date": row["last_updated_date"], "samples_count": 1}
+            for column, aggregate in self.daily_rollup_columns.items():
+                daily_row[f"{column}_{aggregate}"] = row[column]
+                if aggregate == "sum":
+                    daily_row[f"{column}_count"] = int(row[column] is not None)
+            daily_rows_list.append(daily_row)
+        if len(daily_rows_list) == 0:
+            return None
+        daily_columns = DailyStatuses.__table__.c
+        statement = insert(DailyStatuses.__table__)
+        set_columns = {"samples_count": daily_columns.samples_count + statement.excluded.samples_count}
+        for column, aggregate in self.daily_rollup_columns.items():
+            rollup_column = f"{column}_{aggregate}"
+            stored_value, new_value = daily_columns[rollup_column], statement.excluded[rollup_column]
+            set_columns[rollup_column] = func.coalesce( # Either Side May Be NULL
+                stored_value + new_value if aggregate == "sum" else func.max(stored_value, new_value),
+                stored_value,
+                new_value
+                )
+            if aggregate == "sum":
+                set_columns[f"{column}_count"] = daily_columns[f"{column}_count"] + statement.excluded[f"{column}_count"]
+        session.execute(
+            statement.on_conflict_do_update(index_elements=["asset_id", "last_updated_date"], set_=set_columns),
+            daily_rows_list
+            )
+
+        # Each Asset's Indicators Advance From Its Earliest Changed Day
+        assets_from_dates = {}
+        for daily_row in daily_rows_list:
+            assets_from_dates[daily_row["asset_id"]] = min(
+                assets_from_dates.get(daily_row["asset_id"], daily_row["last_updated_date"]),
+                daily_row["last_updated_date"]
+                )
+        for asset_id, from_date in assets_from_dates.items():
+            self.update_daily_indicators(session.connection(), asset_id, from_date)
         return None
+
+    def get_daily_statuses_query(self, asset_id):
+        # An Asset's Daily Means From Running Sums And Counts, Daily Maxes As Stored
+        daily_statuses_query = select(
+            DailyStatuses.last_updated_date,
+            *[
+                (
+                    DailyStatuses.__table__.c[f"{column}_sum"] / func.nullif(DailyStatuses.__table__.c[f"{column}_count"], 0)
+                    if aggregate == "sum"
+                    else DailyStatuses.__table__.c[f"{column}_max"]
+                    ).label(column)
+                for column, aggregate in self.daily_rollup_columns.items()
+                ]
+            ).where(DailyStatuses.asset_id == asset_id).order_by(DailyStatuses.last_updated_date)
+        return daily_statuses_query
+
+    def update_daily_indicators(self, connection, asset_id=None, from_date=None):
+        # Advances Each Indicator From Its Stored State Before from_date; Without One, Rebuilds From Scratch
+        if asset_id is None: # Every Asset In The Rollup
+            for rollup_asset_id in connection.scalars(select(DailyStatuses.asset_id).distinct()).all():
+                self.update_daily_indicators(connection, rollup_asset_id, from_date)
+            return None
+        daily_indicators_table = DailyIndicators.__table__
+        for indicator in self.indicator_manager.indicators:
+            indicator_from_date = from_date
+            if indicator_from_date is not None and connection.scalar(
+                select(DailyIndicators.indicator_name)
+                .where(DailyIndicators.asset_id == asset_id, DailyIndicators.indicator_name == indicator.name)
+                .limit(1)
+                ) is None:
+                indicator_from_date = None # New Indicators Backfill Their Whole History Once
+
+            state = None
+            daily_statuses_query = self.get_daily_statuses_query(asset_id)
+            if indicator_from_date is None:
+                connection.execute(
+                    daily_indicators_table.delete()
+                    .where(
+                        daily_indicators_table.c.asset_id == asset_id,
+                        daily_indicators_table.c.indicator_name == indicator.name
+                        )
+                    )
+            else:
+                state_json = connection.scalar(
+                    select(DailyIndicators.state)
+                    .where(
+                        DailyIndicators.asset_id == asset_id,
+                        DailyIndicators.indicator_name == indicator.name,
+                        DailyIndicators.last_updated_date < indicator_from_date
+                        )
+                    .order_by(DailyIndicators.last_updated_date.desc())
+                    .limit(1)
+                    )
+                state = json.loads(state_json) if state_json is not None else None
+                daily_statuses_query = daily_statuses_query.where(
+                    DailyStatuses.last_updated_date >= indicator_from_date
+                    )
+
+            indicator_rows_list = [
+                {**row, "asset_id": asset_id, "state": json.dumps(row["state"])}
+                for row in self.indicator_manager.advance(
+                    indicator,
+                    state,
+                    connection.execute(daily_statuses_query).mappings().all()
+                    )
+                ]
+            if len(indicator_rows_list) > 0:
+                statement = insert(daily_indicators_table)
+                connection.execute(
+                    statement.on_conflict_do_update(
+                        index_elements=["asset_id", "indicator_name", "last_updated_date"],
+                        set_={"value": statement.excluded.value, "state": statement.excluded.state}
+                        ),
+                    indicator_rows_list
+                    )
+        return None
+
+    def rebuild_daily_indicators(self):
+        # For Backfills That Rewrite History
+        with self.engine.begin() as connection:
+            self.update_daily_indicators(connection)
+        return None
+
+    def rebuild_daily_statuses(self):
+        with self.engine.begin() as connection:
+            for statement in DAILY_STATUSES_REBUILD_SQL:
+                connection.exec_driver_sql(statement)
+            self.update_daily_indicators(connection) # Indicators Derive From The Rollup
+        return None
+
+    def insert_news(self, session, news_rows_list):
+        # INSERT ... ON CONFLICT(url_to_post) DO NOTHING, Then Links Each Article To Its Assets
+        if len(news_rows_list) == 0:
+            return 0
+        session.execute(
+            insert(News.__table__).on_conflict_do_nothing(index_elements=["url_to_post"]), 
+            [{column: value for column, value in row.items() if column != "asset_ids"} for row in news_rows_list]
+            )
+        news_ids = dict(
+            session.execute(
+                select(News.url_to_post, News.id)
+                .where(News.url_to_post.in_([row["url_to_post"] for row in news_rows_list]))
+                ).all()
+            )
+
+        # Counted Per Article: New When Any Of Its Assets Had Not Linked It Yet
+        seen_links = set(
+            tuple(result)
+            for result in session.execute(
+                select(NewsAssets.news_id, NewsAssets.asset_id)
+                .where(NewsAssets.news_id.in_(list(news_ids.values())))
+                ).all()
+            )
+        news_assets_rows_list = []
+        inserted_count = 0
+        for row in news_rows_list:
+            new_links = [
+                (news_ids[row["url_to_post"]], asset_id) for asset_id in row.get("asset_ids", [])
+                if (news_ids[row["url_to_post"]], asset_id) not in seen_links
+                ]
+            seen_links.update(new_links)
+            news_assets_rows_list.extend({"news_id": news_id, "asset_id": asset_id} for news_id, asset_id in new_links)
+            inserted_count += int(len(new_links) > 0)
+        if len(news_assets_rows_list) > 0:
+            session.execute(insert(NewsAssets.__table__), news_assets_rows_list)
+        return inserted_count
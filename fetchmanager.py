@@ -0,0 +1,143 @@
+"""
+Purpose: A fetch manager for The Daily BTC Web Application.
+"""
+
+import os
+import time
+import random
+import threading
+import statistics
+import requests
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from requests.adapters import HTTPAdapter
+from dotenv import load_dotenv
+
+load_dotenv()
+
+class FetchManager:
+    def __init__(self):
+        # Parameters
+        self.connect_timeout_sec = float(os.getenv("FETCH_CONNECT_TIMEOUT_SEC", 5))
+        self.read_timeout_sec = float(os.getenv("FETCH_READ_TIMEOUT_SEC", 30))
+        self.max_retries = int(os.getenv("FETCH_MAX_RETRIES", 3))
+        self.backoff_base_sec = 1
+        self.backoff_max_sec = 30
+        self.retry_status_codes = {429, 500, 502, 503, 504}
+        self.latency_samples_count = 100 # Recent Requests Kept Per Source For Latency Stats
+        self.sources_rates_per_min = { # Request Starts Allowed Per Minute, Shared By Every Thread Calling A Source
+            "coingecko": float(os.getenv("COINGECKO_RATE_LIMIT_PER_MIN", 30)) # Demo Plan Limit
+            }
+
+        # Session: Keep-Alive Connections Pooled Per Host And Shared By The Fetch Threads
+        self.session = requests.Session()
+        for prefix in ["https://", "http://"]:
+            self.session.mount(prefix, HTTPAdapter(pool_connections=4, pool_maxsize=4))
+        self.fetch_executor = ThreadPoolExecutor(max_workers=4, thread_name_prefix="fetch")
+
+        # Rate Limiter Per Source: The Earliest Time Its Next Request May Start
+        self.sources_next_start_times = {}
+        self.rate_limiter_lock = threading.Lock()
+
+        # Stats Per Source
+        self.fetch_stats = {}
+        self.fetch_stats_lock = threading.Lock()
+        return None
+
+    def fetch(self, source_name, url, params=None, headers=None):
+        # Connection Errors, Timeouts And Retryable Statuses Are Retried With Jittered Backoff
+        for attempt in range(self.max_retries + 1):
+            self.wait_for_rate_limit(source_name)
+            start_time = time.perf_counter()
+            try:
+                response = self.session.get(
+                    url=url,
+                    params=params,
+                    headers=headers,
+                    timeout=(self.connect_timeout_sec, self.read_timeout_sec)
+                    )
+                error = (
+                    requests.HTTPError(f"{response.status_code} from {source_name}", response=response)
+                    if response.status_code in self.retry_status_codes
+                    else None
+                    )
+            except (requests.ConnectionError, requests.Timeout) as exception:
+                response, error = None, exception
+            self.record_fetch(
+                source_name,
+                time.perf_counter() - start_time,
+                error is not None or not response.ok,
+                attempt > 0
+                )
+            if error is None:
+                response.raise_for_status() # Other Client Errors Are Not Worth Retrying
+                return response
+            if response is not None and "Retry-After" in response.headers:
+                break # The Upstream Set Its Own Wait, Which The Schedule Manager Honors
+            if attempt < self.max_retries:
+                time.sleep(self.get_backoff_sec(attempt))
+        raise error
+
+    def fetch_all(self, fetch_requests):
+        # Requests Are Fetched Concurrently; A Failed Request Comes Back As Its Exception
+        # Requests Name Their Source, Such As One CoinGecko Request Per Asset, Or Are Keyed By It
+        fetch_futures = {
+            fetch_name: self.fetch_executor.submit(self.fetch, **{"source_name": fetch_name, **fetch_request})
+            for fetch_name, fetch_request in fetch_requests.items()
+            }
+        fetch_results = {}
+        for fetch_name, fetch_future in fetch_futures.items():
+            try:
+                fetch_results[fetch_name] = fetch_future.result()
+            except requests.RequestException as exception:
+                fetch_results[fetch_name] = exception
+        return fetch_results
+
+    def wait_for_rate_limit(self, source_name):
+        # Slots Are Reserved Under The Lock, Then Waited For Outside It, So Threads Queue In Order
+        rate_per_min = self.sources_rates_per_min.get(source_name)
+        if rate_per_min is None:
+            return None
+        with self.rate_limiter_lock:
+            now = time.monotonic()
+            start_time = max(now, self.sources_next_start_times.get(source_name, now))
+            self.sources_next_start_times[source_name] = start_time + 60 / rate_per_min
+        time.sleep(start_time - now)
+        return None
+
+    def get_backoff_sec(self, attempt):
+        # Full Jitter, So Retries From Several Sources Or Workers Do Not Line Up
+        return random.uniform(0, min(self.backoff_max_sec, self.backoff_base_sec * 2 ** attempt))
+
+    def record_fetch(self, source_name, latency_sec, failed, retried):
+        with self.fetch_stats_lock:
+            source_stats = self.fetch_stats.setdefault(
+                source_name,
+                {
+                    "requests": 0,
+                    "failures": 0,
+                    "retries": 0,
+                    "latencies_sec": deque(maxlen=self.latency_samples_count)
+                    }
+                )
+            source_stats["requests"] += 1
+            source_stats["failures"] += int(failed)
+            source_stats["retries"] += int(retried)
+            source_stats["latencies_sec"].append(latency_sec)
+        return None
+
+    def get_fetch_stats(self):
+        with self.fetch_stats_lock:
+            fetch_stats = {}
+            for source_name, source_stats in self.fetch_stats.items():
+                latencies_ms = sorted(latency_sec * 1000 for latency_sec in source_stats["latencies_sec"])
+                fetch_stats[source_name] = {
+                    "requests": source_stats["requests"],
+                    "failures": source_stats["failures"],
+                    "retries": source_stats["retries"],
+                    "mean_ms": statistics.fmean(latencies_ms),
+                    "p50_ms": latencies_ms[len(latencies_ms) // 2],
+                    "p95_ms": latencies_ms[min(int(len(latencies_ms) * 0.95), len(latencies_ms) - 1)],
+                    "max_ms": latencies_ms[-1]
+                    }
+        return fetch_stats
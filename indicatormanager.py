@@ -0,0 +1,41 @@
+"""
+Purpose: An indicator manager for The Daily BTC Web Application.
+"""
+
+class ExponentialMovingAverage:
+    def __init__(self, name, column, span):
+        # Parameters
+        self.name = name
+        self.column = column
+        self.alpha = 2 / (span + 1) # Same Smoothing As pandas' ewm(span=span, adjust=False)
+        return None
+
+    def advance(self, state, daily_row):
+        value = daily_row[self.column]
+        if value is None: # Days Without The Column Carry The Previous Value
+            return (state["ema"] if state is not None else None), state
+        ema = value if state is None else self.alpha * value + (1 - self.alpha) * state["ema"]
+        return ema, {"ema": ema}
+
+class IndicatorManager:
+    def __init__(self):
+        # Indicators: Each Advances From Its Previous Day's State, So New Days Never Replay History
+        self.indicators = [
+            ExponentialMovingAverage("price_ema50_usd", "price_usd", 50),
+            ExponentialMovingAverage("price_ema200_usd", "price_usd", 200)
+            ]
+        return None
+
+    def advance(self, indicator, state, daily_rows_list):
+        indicator_rows_list = []
+        for daily_row in daily_rows_list:
+            value, state = indicator.advance(state, daily_row)
+            indicator_rows_list.append(
+                {
+                    "indicator_name": indicator.name,
+                    "last_updated_date": daily_row["last_updated_date"],
+                    "value": value,
+                    "state": state
+                    }
+                )
+        return indicator_rows_list
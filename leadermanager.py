@@ -0,0 +1,32 @@
+"""
+Purpose: A leader manager for The Daily BTC Web Application.
+"""
+
+import os
+from dotenv import load_dotenv
+from filelock import FileLock, Timeout
+
+load_dotenv()
+
+class LeaderManager:
+    def __init__(self):
+        # Parameters
+        self.campaign_rate_sec = 60 # Followers Retry The Lock This Often, Bounding Failover Time
+        self.lock_path = os.getenv(
+            "LEADER_LOCK_PATH",
+            os.path.join(os.path.dirname(os.getenv("DB_PATH", "")), "leader.lock")
+            )
+
+        # Lock: Held For The Leader's Lifetime; The OS Releases It If The Leader Dies
+        self.lock = FileLock(self.lock_path, thread_local=False)
+        self.is_leader = False
+        return None
+
+    def try_acquire(self):
+        if not self.is_leader:
+            try:
+                self.lock.acquire(timeout=0)
+                self.is_leader = True
+            except Timeout:
+                pass
+        return self.is_leader
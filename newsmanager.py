@@ -0,0 +1,98 @@
+"""
+Purpose: A news manager for The Daily BTC Web Application.
+"""
+
+import os
+import pandas as pd
+from dotenv import load_dotenv
+
+load_dotenv()
+
+class NewsManager:
+    def __init__(self):
+        # Parameters
+        self.retention_days = int(os.getenv("NEWS_RETENTION_DAYS", 30)) # Oldest Window On The Dashboard Is 30 Days
+        self.categorical_columns = ["source_name", "sentiment_label"]
+        self.dropped_columns = ["content_preview"] # Only Needed For Inference
+        self.news_windows = { # Days Back From Today: (Start, End), Where None Is Open-Ended
+            "today": (1, None),
+            "this_week": (7, 1),
+            "this_month": (30, 7)
+            }
+
+        # Store: Sorted By published_date, With A Hash Index On id
+        self.news_df = pd.DataFrame()
+        self.news_ids = set()
+
+        # Rankings: Each Day's Top Article, And Each Window's Top Article Cached Per Day
+        self.daily_top_news = {}
+        self.window_top_news = None
+        self.window_top_news_date = None
+        return None
+
+    def get_unseen_news(self, news_df, now):
+        # Articles Past The Retention Horizon Would Be Evicted Right After Scoring, So They Are Skipped
+        if len(news_df) == 0:
+            return news_df
+        return news_df.loc[
+            ~news_df["id"].isin(self.news_ids)
+            & (pd.to_datetime(news_df["published_date"], utc=True) >= self.get_retention_horizon(now))
+            ].drop_duplicates("id")
+
+    def add_news(self, news_df, now):
+        if len(news_df) > 0:
+            news_df = news_df.drop(columns=self.dropped_columns, errors="ignore")
+            news_df["sentiment_score"] = news_df["sentiment_score"].astype("float32")
+            self.update_daily_top_news(news_df.reset_index(drop=True))
+            self.news_df = (
+                pd.concat([self.news_df, news_df], axis="index", ignore_index=True)
+                if len(self.news_df) > 0
+                else news_df
+                ).sort_values("published_date", kind="stable", ignore_index=True)
+        if len(self.news_df) > 0:
+            self.evict_news(now)
+            self.news_df = self.news_df.astype({column: "category" for column in self.categorical_columns})
+            self.news_ids = set(self.news_df["id"].to_list())
+        return None
+
+    def evict_news(self, now):
+        # Keeps Memory Flat: Anything Older Than The Retention Horizon Is Dropped
+        horizon = self.get_retention_horizon(now)
+        self.news_df = self.news_df.iloc[
+            self.news_df["published_date"].searchsorted(horizon, side="left"):
+            ].reset_index(drop=True)
+        for published_date in [date for date in self.daily_top_news if date < horizon]:
+            del self.daily_top_news[published_date]
+        return None
+
+    def get_retention_horizon(self, now):
+        return now.floor("D") - pd.DateOffset(days=self.retention_days)
+
+    def update_daily_top_news(self, news_df):
+        # Only The New Articles Are Ranked, Then Merged Into Each Day's Top Article
+        for news in news_df.loc[news_df.groupby("published_date")["sentiment_score"].idxmax()].to_dict("records"):
+            top_news = self.daily_top_news.get(news["published_date"])
+            if top_news is None or news["sentiment_score"] > top_news["sentiment_score"]:
+                self.daily_top_news[news["published_date"]] = news
+                self.window_top_news = None
+        return None
+
+    def get_window_top_news(self, now):
+        # Recomputed From At Most One Article Per Day, Only When Articles Arrive Or The Day Rolls Over
+        today = now.floor("D")
+        if self.window_top_news is None or self.window_top_news_date != today:
+            self.window_top_news = {}
+            for window_name, (start_days, end_days) in self.news_windows.items():
+                start = today - pd.DateOffset(days=start_days)
+                end = today - pd.DateOffset(days=end_days) if end_days is not None else None
+                window_news_list = [
+                    news for published_date, news in self.daily_top_news.items()
+                    if published_date >= start and (end is None or published_date < end)
+                    ]
+                self.window_top_news[window_name] = (
+                    max(window_news_list, key=lambda news: news["sentiment_score"])
+                    if len(window_news_list) > 0
+                    else None
+                    )
+            self.window_top_news_date = today
+        return self.window_top_news
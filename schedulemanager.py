@@ -0,0 +1,134 @@
+"""
+Purpose: A schedule manager for The Daily BTC Web Application.
+"""
+
+import os
+import time
+import datetime as dt
+from email.utils import parsedate_to_datetime
+from dotenv import load_dotenv
+
+load_dotenv()
+
+class ScheduleManager:
+    def __init__(self, sources_requests_per_poll=None):
+        # Parameters: Bounds Per Source, Where The Minimum Keeps Each API Within Its Free Plan When Polled With One Request
+        self.sources_intervals = {
+            "coingecko": {
+                "min_sec": int(os.getenv("COINGECKO_MIN_INTERVAL_SEC", 60 * 10)),
+                "max_sec": int(os.getenv("COINGECKO_MAX_INTERVAL_SEC", 60 * 60 * 8))
+                },
+            "news": {
+                "min_sec": int(os.getenv("NEWS_MIN_INTERVAL_SEC", 60 * 30)), # News API Allows 100 Requests Per Day
+                "max_sec": int(os.getenv("NEWS_MAX_INTERVAL_SEC", 60 * 60 * 8))
+                }
+            }
+        for source_name, requests_per_poll in (sources_requests_per_poll or {}).items():
+            # Free Plans Count Requests, So Polls Made Of Several Requests (Such As One Per Asset) Run Less Often
+            intervals = self.sources_intervals[source_name]
+            intervals["min_sec"] *= max(requests_per_poll, 1)
+            intervals["max_sec"] = max(intervals["max_sec"], intervals["min_sec"])
+        self.speedup_factor = 0.5 # Applied When A Poll Brings New Rows
+        self.slowdown_factor = 2 # Applied When A Poll Brings Nothing New
+        self.remaining_headers = ["X-RateLimit-Remaining", "RateLimit-Remaining"]
+        self.reset_headers = ["X-RateLimit-Reset", "RateLimit-Reset"]
+
+        # State Per Source: Cadence, Conditional Request Validators Per Request (Such As One Per Asset) And Quota
+        self.sources_states = {
+            source_name: {
+                "interval_sec": max(intervals["max_sec"] / 2, intervals["min_sec"]),
+                "not_before": 0, # Monotonic Time Before Which The Source Must Not Be Polled
+                "validators": {}, # Request Key: {"etag", "last_modified"}
+                "remaining": None,
+                "reset_sec": None
+                }
+            for source_name, intervals in self.sources_intervals.items()
+            }
+        return None
+
+    def get_conditional_headers(self, source_name, request_key=None):
+        validators = self.sources_states[source_name]["validators"].get(request_key, {})
+        conditional_headers = {}
+        if validators.get("etag") is not None:
+            conditional_headers["If-None-Match"] = validators["etag"]
+        if validators.get("last_modified") is not None:
+            conditional_headers["If-Modified-Since"] = validators["last_modified"]
+        return conditional_headers
+
+    def record_response(self, source_name, responses, inserted_count):
+        # One Call Per Poll, With Each Request's Response (Or Its Error's, If Any); Failed Polls Have No Insert Count
+        source_state = self.sources_states[source_name]
+        intervals = self.sources_intervals[source_name]
+        responses = {request_key: response for request_key, response in responses.items() if response is not None}
+        for request_key, response in responses.items():
+            if response.status_code < 300:
+                validators = source_state["validators"].setdefault(request_key, {"etag": None, "last_modified": None})
+                validators["etag"] = response.headers.get("ETag", validators["etag"])
+                validators["last_modified"] = response.headers.get("Last-Modified", validators["last_modified"])
+            retry_after_sec = self.get_retry_after_sec(response)
+            if retry_after_sec is not None:
+                source_state["not_before"] = max(source_state["not_before"], time.monotonic() + retry_after_sec)
+
+        # Quota Is Shared By The Poll's Requests, So The Lowest Remaining Count Is The Latest
+        if len(responses) > 0:
+            quotas_list = [
+                (self.get_header_number(response, self.remaining_headers), self.get_reset_sec(response))
+                for response in responses.values()
+                ]
+            source_state["remaining"], source_state["reset_sec"] = min(
+                quotas_list,
+                key=lambda quota: float("inf") if quota[0] is None else quota[0]
+                )
+
+        # Adaptive Cadence: Faster While The Data Changes, Slower While It Does Not; Failed Polls Keep It
+        if inserted_count is not None:
+            source_state["interval_sec"] = min(
+                max(
+                    source_state["interval_sec"] * (self.speedup_factor if inserted_count > 0 else self.slowdown_factor),
+                    intervals["min_sec"]
+                    ),
+                intervals["max_sec"]
+                )
+        return None
+
+    def get_next_delay_sec(self, source_name):
+        source_state = self.sources_states[source_name]
+        delay_sec = source_state["interval_sec"]
+
+        # Remaining Quota Is Spread Evenly Until It Resets
+        if source_state["remaining"] is not None and source_state["reset_sec"] is not None:
+            delay_sec = max(
+                delay_sec,
+                source_state["reset_sec"] / source_state["remaining"]
+                if source_state["remaining"] > 0
+                else source_state["reset_sec"]
+                )
+        return max(delay_sec, source_state["not_before"] - time.monotonic())
+
+    def get_header_number(self, response, header_names):
+        for header_name in header_names:
+            try:
+                return float(response.headers[header_name])
+            except (KeyError, ValueError):
+                continue
+        return None
+
+    def get_reset_sec(self, response):
+        # Reset Headers Hold Either Seconds Until The Reset Or Its Epoch Time
+        reset_value = self.get_header_number(response, self.reset_headers)
+        if reset_value is None:
+            return None
+        return max(reset_value - time.time(), 0) if reset_value > 1e9 else reset_value
+
+    def get_retry_after_sec(self, response):
+        # Retry-After Holds Either Seconds Or An HTTP Date
+        retry_after = response.headers.get("Retry-After")
+        if retry_after is None:
+            return None
+        try:
+            return max(float(retry_after), 0)
+        except ValueError:
+            try:
+                return max((parsedate_to_datetime(retry_after) - dt.datetime.now(dt.timezone.utc)).total_seconds(), 0)
+            except (TypeError, ValueError):
+                return None
@@ -0,0 +1,236 @@
+"""
+Purpose: A sentiment manager for The Daily BTC Web Application.
+"""
+
+import os
+import time
+import contextlib
+
+# Fixed Headlines For Checking Label Parity Between Backends
+PARITY_FIXTURES = [
+    "Title: Bitcoin hits a new all-time high as ETF inflows surge Description: Spot ETFs drew record inflows this week.",
+    "Title: Bitcoin slides 10% after exchange hack Description: Investors fled as millions in BTC were stolen.",
+    "Title: Bitcoin trades flat ahead of Fed decision Description: Markets await the central bank's rate announcement.",
+    "Title: Miners report record hash rate Description: Network security reached its highest level on record.",
+    "Title: Regulators sue major crypto exchange Description: The lawsuit alleges securities law violations.",
+    "Title: Bitcoin halving is weeks away Description: The block reward will drop from 6.25 to 3.125 BTC.",
+    "Title: Analysts warn of a prolonged bear market Description: Funding rates and volumes keep falling.",
+    "Title: Country adopts Bitcoin as legal tender Description: Lawmakers approved the bill by a wide margin.",
+    "Title: Lightning Network capacity keeps growing Description: Payment channels crossed a new milestone.",
+    "Title: Bitcoin whale moves coins dormant since 2010 Description: The transfer sparked speculation online.",
+    "Title: Crypto lender files for bankruptcy Description: Customers face losses as withdrawals stay frozen.",
+    "Title: Bitcoin volatility falls to multi-year low Description: Options markets price in calmer trading."
+    ]
+
+class SentimentManager:
+    def __init__(self, backend=None, batch_size=16, max_length=128, num_threads=None):
+        # Parameters
+        self.model_name = "cardiffnlp/twitter-roberta-base-sentiment"
+        self.model_revision = "main"
+        self.backend = backend or os.getenv("SENTIMENT_BACKEND", "fp32")
+        self.backends = { # Backend Name: Pipeline Loader
+            "fp32": self.load_fp32_pipeline,
+            "int8": self.load_int8_pipeline, # Dynamic int8 Quantization Of The PyTorch Linear Layers
+            "onnx": self.load_onnx_pipeline # ONNX Runtime On CPU, Requires optimum[onnxruntime]
+            }
+        self.model_version = f"{self.model_revision}-{self.backend}"
+        self.batch_size = batch_size
+        self.max_length = max_length # Tokens Kept Per Article; Longer Texts Are Truncated
+        self.num_threads = num_threads # Intra-Op Threads; None Keeps The Backend Default
+        self.labels = {"LABEL_0": "NEGATIVE", "LABEL_1": "NEUTRAL", "LABEL_2": "POSITIVE"}
+
+        # Model: Loaded On First Use, So Builds Served Entirely From Cached Sentiments Never Pay For It
+        if self.backend not in self.backends:
+            raise ValueError(f"Unknown sentiment backend '{self.backend}'; expected one of {list(self.backends)}")
+        self.sentiment_pipeline = None
+        return None
+
+    def get_sentiment_pipeline(self):
+        if self.sentiment_pipeline is None:
+            self.set_num_threads()
+            self.sentiment_pipeline = self.backends[self.backend]()
+        return self.sentiment_pipeline
+
+    def load_fp32_pipeline(self):
+        from transformers import pipeline
+        sentiment_pipeline = pipeline(
+            task="sentiment-analysis",
+            model=self.model_name,
+            revision=self.model_revision
+            )
+        return sentiment_pipeline
+
+    def load_int8_pipeline(self):
+        import torch
+        from transformers import pipeline, AutoModelForSequenceClassification, AutoTokenizer
+        model = AutoModelForSequenceClassification.from_pretrained(self.model_name, revision=self.model_revision)
+        model = torch.quantization.quantize_dynamic(model, {torch.nn.Linear}, dtype=torch.qint8)
+        sentiment_pipeline = pipeline(
+            task="sentiment-analysis",
+            model=model,
+            tokenizer=AutoTokenizer.from_pretrained(self.model_name, revision=self.model_revision)
+            )
+        return sentiment_pipeline
+
+    def load_onnx_pipeline(self):
+        import onnxruntime
+        from optimum.onnxruntime import ORTModelForSequenceClassification
+        from transformers import pipeline, AutoTokenizer
+        session_options = onnxruntime.SessionOptions()
+        if self.num_threads is not None:
+            session_options.intra_op_num_threads = self.num_threads
+        model = ORTModelForSequenceClassification.from_pretrained(
+            self.model_name,
+            revision=self.model_revision,
+            export=True,
+            provider="CPUExecutionProvider",
+            session_options=session_options
+            )
+        sentiment_pipeline = pipeline(
+            task="sentiment-analysis",
+            model=model,
+            tokenizer=AutoTokenizer.from_pretrained(self.model_name, revision=self.model_revision)
+            )
+        return sentiment_pipeline
+
+    def set_num_threads(self):
+        if self.num_threads is None:
+            return None
+        from transformers.utils import is_tf_available, is_torch_available
+        if is_torch_available():
+            import torch
+            torch.set_num_threads(self.num_threads)
+        elif is_tf_available():
+            import tensorflow as tf
+            try:
+                tf.config.threading.set_intra_op_parallelism_threads(self.num_threads)
+            except RuntimeError: # TensorFlow Only Accepts This Before Its Runtime Starts
+                pass
+        return None
+
+    def get_inference_context(self):
+        if self.get_sentiment_pipeline().framework == "pt":
+            import torch
+            return torch.inference_mode()
+        return contextlib.nullcontext()
+
+    def score(self, texts_list):
+        if len(texts_list) == 0:
+            return []
+
+        # Sort By Length So Each Batch Pads To Similar Sizes
+        order_list = sorted(range(len(texts_list)), key=lambda i: len(texts_list[i]))
+        with self.get_inference_context():
+            results_list = self.get_sentiment_pipeline()(
+                [texts_list[i] for i in order_list],
+                batch_size=self.batch_size,
+                truncation=True,
+                max_length=self.max_length
+                )
+
+        # Restore The Input Order
+        sentiments_list = [None] * len(texts_list)
+        for i, result in zip(order_list, results_list):
+            sentiments_list[i] = {
+                "sentiment_label": self.labels.get(result["label"], result["label"]),
+                "sentiment_score": result["score"]
+                }
+        return sentiments_list
+
+    def benchmark(self, texts_list, configurations_list):
+        default_configuration = {
+            "batch_size": self.batch_size,
+            "max_length": self.max_length,
+            "num_threads": self.num_threads
+            }
+        benchmark_results = []
+        for configuration in configurations_list:
+            configuration = {**default_configuration, **configuration}
+            self.batch_size = configuration["batch_size"]
+            self.max_length = configuration["max_length"]
+            self.num_threads = configuration["num_threads"]
+            self.set_num_threads()
+
+            start_time = time.perf_counter()
+            self.score(texts_list)
+            elapsed_sec = time.perf_counter() - start_time
+            benchmark_results.append(
+                {
+                    **configuration,
+                    "articles": len(texts_list),
+                    "elapsed_sec": elapsed_sec,
+                    "articles_per_sec": len(texts_list) / elapsed_sec
+                    }
+                )
+
+        # Restore The Original Configuration
+        self.batch_size = default_configuration["batch_size"]
+        self.max_length = default_configuration["max_length"]
+        self.num_threads = default_configuration["num_threads"]
+        self.set_num_threads()
+        return benchmark_results
+
+    def compare_backends(self, texts_list=PARITY_FIXTURES, backends_list=None):
+        # Label Parity Against This Manager's Labels, Plus Memory And Latency Per Backend
+        reference_labels = [result["sentiment_label"] for result in self.score(texts_list)]
+        comparison_results = []
+        for backend in backends_list or list(self.backends):
+            rss_before_bytes = get_rss_bytes()
+            start_time = time.perf_counter()
+            sentiment_manager = (
+                self if backend == self.backend
+                else SentimentManager(backend, self.batch_size, self.max_length, self.num_threads)
+                )
+            sentiment_manager.get_sentiment_pipeline() # Loaded Lazily, So Load It Here To Time It Apart From Scoring
+            load_sec = time.perf_counter() - start_time
+            rss_after_bytes = get_rss_bytes()
+
+            start_time = time.perf_counter()
+            labels = [result["sentiment_label"] for result in sentiment_manager.score(texts_list)]
+            elapsed_sec = time.perf_counter() - start_time
+            comparison_results.append(
+                {
+                    "backend": backend,
+                    "label_parity": sum(a == b for a, b in zip(labels, reference_labels)) / len(texts_list),
+                    "load_rss_mb": (rss_after_bytes - rss_before_bytes) / 1024 ** 2, # Approximate; 0 For The Loaded Backend
+                    "load_sec": load_sec,
+                    "latency_ms_per_article": elapsed_sec * 1000 / len(texts_list)
+                    }
+                )
+        return comparison_results
+
+def get_rss_bytes():
+    # Resident Set Size Of This Process (Linux), Used For Rough Per-Backend Memory Numbers
+    try:
+        with open("/proc/self/statm") as statm_file:
+            return int(statm_file.read().split()[1]) * os.sysconf("SC_PAGE_SIZE")
+    except (OSError, ValueError):
+        import resource
+        return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss * 1024
+
+if __name__ == "__main__":
+    # CPU Benchmark Over The Stored News Articles
+    from databasemanager import DataBaseManager
+    news_df = DataBaseManager().read_database_frames()["news"].dropna()
+    texts_list = ("Title: " + news_df["title"] + " Description: " + news_df["description"]).to_list()
+    sentiment_manager = SentimentManager()
+    sentiment_manager.score(texts_list[:8]) # Warm Up
+    configurations_list = [
+        {"batch_size": batch_size, "max_length": max_length, "num_threads": num_threads}
+        for num_threads in sorted({1, os.cpu_count()})
+        for max_length in [64, 128]
+        for batch_size in [1, 8, 32]
+        ]
+    for result in sentiment_manager.benchmark(texts_list, configurations_list):
+        print(
+            f"threads={result['num_threads']:>3} max_length={result['max_length']:>4} "
+            f"batch_size={result['batch_size']:>3} -> {result['articles_per_sec']:,.1f} articles/sec"
+            )
+
+    # Backend Comparison On The Parity Fixtures
+    for result in SentimentManager(backend="fp32").compare_backends():
+        print(
+            f"backend={result['backend']:>4} parity={result['label_parity']:.0%} "
+            f"rss=+{result['load_rss_mb']:,.0f} MB load={result['load_sec']:.1f}s "
+            f"latency={result['latency_ms_per_article']:.1f} ms/article"
+            )
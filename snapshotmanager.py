@@ -0,0 +1,71 @@
+"""
+Purpose: A snapshot manager for The Daily BTC Web Application.
+"""
+
+import os
+import json
+import tempfile
+import datetime as dt
+import pandas as pd
+from dotenv import load_dotenv
+from plotly.utils import PlotlyJSONEncoder
+
+load_dotenv()
+
+class SnapshotManager:
+    def __init__(self):
+        # Parameters
+        self.snapshot_version = 1 # Bump When The Layout Of dash_objects Changes
+        self.snapshot_path = os.getenv( # Each Asset Gets Its Own File, Named After This One
+            "SNAPSHOT_PATH",
+            os.path.join(os.path.dirname(os.getenv("DB_PATH", "")), "dash-snapshot.json")
+            )
+        return None
+
+    def get_snapshot_path(self, asset_id):
+        snapshot_root, snapshot_ext = os.path.splitext(self.snapshot_path)
+        return f"{snapshot_root}-{asset_id}{snapshot_ext}"
+
+    def get_snapshot_mtime(self, asset_id):
+        try:
+            return os.stat(self.get_snapshot_path(asset_id)).st_mtime_ns
+        except FileNotFoundError:
+            return None
+
+    def write_snapshot(self, asset_id, dash_objects, high_water_marks):
+        snapshot = {
+            "snapshot_version": self.snapshot_version,
+            "created_timestamp": dt.datetime.now(dt.timezone.utc).isoformat(),
+            "high_water_marks": high_water_marks,
+            "dash_objects": dash_objects
+            }
+
+        # Written Beside The Target, Then Renamed Over It, So Readers Never See A Partial File
+        snapshot_path = self.get_snapshot_path(asset_id)
+        snapshot_dir = os.path.dirname(os.path.abspath(snapshot_path))
+        with tempfile.NamedTemporaryFile("w", dir=snapshot_dir, suffix=".tmp", delete=False) as snapshot_file:
+            json.dump(snapshot, snapshot_file, cls=PlotlyJSONEncoder)
+            snapshot_file.flush()
+            os.fsync(snapshot_file.fileno())
+        os.replace(snapshot_file.name, snapshot_path)
+        return None
+
+    def read_snapshot(self, asset_id):
+        # Missing, Unreadable Or Older-Format Snapshots Are Ignored
+        try:
+            with open(self.get_snapshot_path(asset_id)) as snapshot_file:
+                snapshot = json.load(snapshot_file)
+        except (FileNotFoundError, json.JSONDecodeError):
+            return None
+        if snapshot.get("snapshot_version") != self.snapshot_version:
+            return None
+        snapshot["dash_objects"]["headline"]["last_updated_timestamp"] = pd.Timestamp(
+            snapshot["dash_objects"]["headline"]["last_updated_timestamp"]
+            )
+        return snapshot
+
+    def is_stale(self, snapshot, high_water_marks):
+        # Stale When The DataBase Holds Rows The Snapshot Was Not Built From; An Empty DataBase Has Nothing To Build
+        if snapshot is None:
+            return any(high_water_mark > 0 for high_water_mark in high_water_marks.values())
+        return snapshot["high_water_marks"] != high_water_marks
@@ -0,0 +1,51 @@
+"""
+Purpose: Shared test fixtures for The Daily BTC Web Application.
+"""
+
+import threading
+import pytest
+from http.server import ThreadingHTTPServer, BaseHTTPRequestHandler
+
+class StubUpstream:
+    # A Local HTTP Server Standing In For CoinGecko Or News API; Tests Set What Each Path Answers
+    def __init__(self):
+        self.routes = {} # Path: Function Of (Call Number, Request Headers) Returning (Status, Headers, Body)
+        self.calls = {} # Path: Calls Received
+        self.requests_headers = {} # Path: Headers Of Each Call
+        self.lock = threading.Lock()
+        self.server = ThreadingHTTPServer(("127.0.0.1", 0), self.get_handler())
+        self.url = f"http://127.0.0.1:{self.server.server_port}"
+        return None
+
+    def get_handler(self):
+        stub_upstream = self
+        class StubHandler(BaseHTTPRequestHandler):
+            def do_GET(self):
+                path = self.path.split("?")[0]
+                with stub_upstream.lock:
+                    stub_upstream.calls[path] = stub_upstream.calls.get(path, 0) + 1
+                    stub_upstream.requests_headers.setdefault(path, []).append(dict(self.headers))
+                    call_number = stub_upstream.calls[path]
+                status_code, headers, body = stub_upstream.routes.get(path, lambda *args: (404, {}, b""))(
+                    call_number,
+                    self.headers
+                    )
+                self.send_response(status_code)
+                for header_name, header_value in headers.items():
+                    self.send_header(header_name, header_value)
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+                return None
+
+            def log_message(self, *args):
+                return None
+        return StubHandler
+
+@pytest.fixture
+def stub_upstream():
+    stub_upstream = StubUpstream()
+    threading.Thread(target=stub_upstream.server.serve_forever, daemon=True).start()
+    yield stub_upstream
+    stub_upstream.server.shutdown()
+    stub_upstream.server.server_close()
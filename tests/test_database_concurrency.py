@@ -0,0 +1,111 @@
+"""
+Purpose: Concurrency tests for the database manager of The Daily BTC Web Application.
+"""
+
+import os
+import multiprocessing
+import datetime as dt
+from sqlalchemy import func, select
+from sqlalchemy.exc import OperationalError
+from sqlalchemy.orm import Session
+from databasemanager import DataBaseManager, Statuses, News, NewsAssets, DailyStatuses
+
+WRITERS_COUNT = 3
+READERS_COUNT = 3
+BATCHES_COUNT = 20
+BATCH_ROWS = 25
+
+def get_statuses_row(writer_id, batch, row):
+    timestamp = dt.datetime(2024, 1, 1, tzinfo=dt.timezone.utc) + dt.timedelta(
+        days=batch,
+        minutes=writer_id * BATCH_ROWS + row
+        )
+    statuses_row = {column.name: None for column in Statuses.__table__.columns if column.name != "id"}
+    statuses_row.update(
+        {
+            "asset_id": "bitcoin",
+            "price_usd": 60000.0 + row,
+            "market_cap_usd": 1200000000000,
+            "total_volume_usd": 30000000000,
+            "last_updated_timestamp": timestamp.strftime("%Y-%m-%dT%H:%M:%S.000Z"),
+            "last_updated_date": timestamp.strftime("%Y-%m-%d")
+            }
+        )
+    return statuses_row
+
+def get_news_row(writer_id, batch, row):
+    news_row = {
+        "source_name": f"source-{writer_id}",
+        "author": "author",
+        "title": f"Bitcoin article {writer_id}-{batch}-{row}",
+        "description": "description",
+        "url_to_post": f"https://example.com/{writer_id}/{batch}/{row}",
+        "url_to_image": "https://example.com/image.png",
+        "published_timestamp": "2024-01-01T00:00:00Z",
+        "published_date": "2024-01-01",
+        "asset_ids": ["bitcoin"]
+        }
+    return news_row
+
+def write_rows(db_path, writer_id):
+    # One Transaction Per Batch, Like Live Ingests And Backfill Chunks
+    os.environ["DB_PATH"] = db_path
+    database_manager = DataBaseManager()
+    errors_list = []
+    for batch in range(BATCHES_COUNT):
+        try:
+            with Session(database_manager.engine) as session, session.begin():
+                database_manager.insert_statuses(
+                    session,
+                    [get_statuses_row(writer_id, batch, row) for row in range(BATCH_ROWS)]
+                    )
+                database_manager.insert_news(
+                    session,
+                    [get_news_row(writer_id, batch, row) for row in range(BATCH_ROWS)]
+                    )
+        except OperationalError as exception:
+            errors_list.append(str(exception))
+    database_manager.engine.dispose()
+    return errors_list
+
+def read_rows(db_path, reader_id):
+    # Incremental Reads, As The Refresh Process Runs Them While Ingest Writes
+    os.environ["DB_PATH"] = db_path
+    database_manager = DataBaseManager()
+    errors_list = []
+    for _ in range(BATCHES_COUNT):
+        try:
+            database_manager.read_database_frames(incremental=True)
+            database_manager.read_high_water_marks()
+        except OperationalError as exception:
+            errors_list.append(str(exception))
+    database_manager.engine.dispose()
+    return errors_list
+
+def test_concurrent_readers_and_writers(tmp_path, monkeypatch):
+    db_path = str(tmp_path / "daily-btc.db")
+    monkeypatch.setenv("DB_PATH", db_path)
+    DataBaseManager().engine.dispose() # Schema Created Up Front, So Workers Only Read And Write
+
+    tasks_list = (
+        [(write_rows, (db_path, writer_id)) for writer_id in range(WRITERS_COUNT)]
+        + [(read_rows, (db_path, reader_id)) for reader_id in range(READERS_COUNT)]
+        )
+    with multiprocessing.get_context("spawn").Pool(len(tasks_list)) as pool:
+        async_results = [pool.apply_async(task, arguments) for task, arguments in tasks_list]
+        errors_list = [error for async_result in async_results for error in async_result.get(timeout=300)]
+    assert errors_list == [] # Such As "database is locked"
+
+    # Every Batch Landed Exactly Once, And The Daily Rollup Agrees With The Raw Rows
+    expected_rows = WRITERS_COUNT * BATCHES_COUNT * BATCH_ROWS
+    database_manager = DataBaseManager()
+    with Session(database_manager.engine) as session:
+        assert session.scalar(select(func.count()).select_from(Statuses)) == expected_rows
+        assert session.scalar(select(func.count()).select_from(News)) == expected_rows
+        assert session.scalar(select(func.count()).select_from(NewsAssets)) == expected_rows
+        assert session.scalar(select(func.sum(DailyStatuses.samples_count))) == expected_rows
+        assert session.scalar(select(func.sum(DailyStatuses.price_usd_count))) == expected_rows
+    assert database_manager.read_high_water_marks()["bitcoin"] == {"statuses": expected_rows, "news": expected_rows}
+    with database_manager.engine.connect() as connection:
+        assert connection.exec_driver_sql("PRAGMA journal_mode").scalar() == "wal"
+    database_manager.engine.dispose()
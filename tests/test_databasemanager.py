@@ -0,0 +1,136 @@
+"""
+Purpose: Tests for the database manager of The Daily BTC Web Application, against a local stub upstream.
+"""
+
+import json
+import pytest
+from sqlalchemy import func, select
+from sqlalchemy.orm import Session
+from databasemanager import DataBaseManager, DailyStatuses, Statuses, News
+
+def get_coingecko_body(asset_id):
+    coingecko_data = {
+        "id": asset_id,
+        "block_time_in_minutes": 10,
+        "market_data": {
+            "current_price": {"usd": 60000.0},
+            "ath": {"usd": 73000},
+            "ath_date": {"usd": "2024-03-14T07:10:36.635Z"},
+            "atl": {"usd": 67},
+            "atl_date": {"usd": "2013-07-06T00:00:00.000Z"},
+            "market_cap": {"usd": 1200000000000},
+            "fully_diluted_valuation": {"usd": 1300000000000},
+            "market_cap_rank": 1,
+            "total_volume": {"usd": 30000000000},
+            "max_supply": 21000000,
+            "circulating_supply": 19700000,
+            "last_updated": "2024-06-01T12:00:00.000Z"
+            },
+        "community_data": {"twitter_followers": 6000000},
+        "developer_data": {
+            "total_issues": 7000,
+            "closed_issues": 6500,
+            "pull_requests_merged": 10000,
+            "pull_request_contributors": 800
+            }
+        }
+    return json.dumps(coingecko_data).encode("utf-8")
+
+def get_news_body():
+    news_data = {
+        "articles": [
+            {
+                "source": {"name": "Source"},
+                "author": "Author",
+                "title": "Bitcoin rallies",
+                "description": "Bitcoin and ethereum move higher.",
+                "url": "https://example.com/bitcoin-rallies",
+                "urlToImage": "https://example.com/image.png",
+                "publishedAt": "2024-06-01T10:00:00Z"
+                }
+            ]
+        }
+    return json.dumps(news_data).encode("utf-8")
+
+@pytest.fixture
+def database_manager(tmp_path, monkeypatch, stub_upstream):
+    monkeypatch.setenv("DB_PATH", str(tmp_path / "daily-btc.db"))
+    monkeypatch.setenv("ASSET_IDS", "bitcoin,ethereum")
+    database_manager = DataBaseManager()
+    database_manager.coingecko_api_endpoint = f"{stub_upstream.url}/coins/{{asset_id}}"
+    database_manager.news_api_endpoint = f"{stub_upstream.url}/news"
+    database_manager.fetch_manager.max_retries = 0
+    database_manager.fetch_manager.sources_rates_per_min = {}
+    yield database_manager
+    database_manager.fetch_manager.fetch_executor.shutdown()
+    database_manager.engine.dispose()
+
+def test_update_database_stores_other_requests_when_one_body_is_unreadable(stub_upstream, database_manager):
+    stub_upstream.routes["/coins/bitcoin"] = lambda call_number, headers: (200, {"ETag": '"btc"'}, get_coingecko_body("bitcoin"))
+    stub_upstream.routes["/coins/ethereum"] = lambda call_number, headers: (200, {"ETag": '"eth"'}, b"<html>Bad Gateway</html>")
+    stub_upstream.routes["/news"] = lambda call_number, headers: (200, {}, get_news_body())
+    listener_calls = []
+    database_manager.add_update_listener(listener_calls.append)
+    coingecko_interval_sec = database_manager.schedule_manager.sources_states["coingecko"]["interval_sec"]
+    news_interval_sec = database_manager.schedule_manager.sources_states["news"]["interval_sec"]
+
+    with pytest.raises(ValueError):
+        database_manager.update_database()
+
+    # The Readable Asset And News API Are Stored, And Listeners Still Hear About Them
+    with Session(database_manager.engine) as session:
+        assert session.scalars(select(Statuses.asset_id)).all() == ["bitcoin"]
+        assert session.scalar(select(func.count()).select_from(News)) == 1
+    assert listener_calls == [
+        {"statuses": {"inserted": 1, "skipped": 0}, "news": {"inserted": 1, "skipped": 0}}
+        ]
+
+    # The Unreadable Request Keeps No Validator, So The Next Poll Fetches Its Body Again; The Poll Counts As Failed
+    assert database_manager.schedule_manager.get_conditional_headers("coingecko", "bitcoin") == {"If-None-Match": '"btc"'}
+    assert database_manager.schedule_manager.get_conditional_headers("coingecko", "ethereum") == {}
+    assert database_manager.schedule_manager.sources_states["coingecko"]["interval_sec"] == coingecko_interval_sec
+    assert database_manager.schedule_manager.sources_states["news"]["interval_sec"] < news_interval_sec
+
+def test_update_database_fails_only_the_request_missing_a_field(stub_upstream, database_manager):
+    stub_upstream.routes["/coins/bitcoin"] = lambda call_number, headers: (200, {}, get_coingecko_body("bitcoin"))
+    stub_upstream.routes["/coins/ethereum"] = lambda call_number, headers: (200, {}, b'{"id": "ethereum"}')
+    stub_upstream.routes["/news"] = lambda call_number, headers: (200, {}, get_news_body())
+
+    with pytest.raises(KeyError):
+        database_manager.update_database(["coingecko"])
+    with Session(database_manager.engine) as session:
+        assert session.scalars(select(Statuses.asset_id)).all() == ["bitcoin"]
+
+def test_insert_statuses_skips_stored_and_repeated_statuses(database_manager):
+    statuses_rows_list = database_manager.get_statuses_rows(json.loads(get_coingecko_body("bitcoin")))
+    with Session(database_manager.engine) as session, session.begin():
+        assert database_manager.insert_statuses(session, statuses_rows_list * 2) == 1
+    with Session(database_manager.engine) as session, session.begin():
+        assert database_manager.insert_statuses(session, statuses_rows_list) == 0
+
+    # The Daily Rollup Counts Only The Stored Status
+    with Session(database_manager.engine) as session:
+        assert session.scalar(select(func.count()).select_from(Statuses)) == 1
+        assert session.scalars(select(DailyStatuses.samples_count)).all() == [1]
+
+def test_migration_removes_duplicate_statuses(database_manager):
+    statuses_rows_list = database_manager.get_statuses_rows(json.loads(get_coingecko_body("bitcoin")))
+    with Session(database_manager.engine) as session, session.begin():
+        database_manager.insert_statuses(session, statuses_rows_list)
+
+    # A Database From Before The Unique Index, Where Two Writers Stored The Same Status
+    with database_manager.engine.begin() as connection:
+        connection.exec_driver_sql("DROP INDEX ix_statuses_asset_id_last_updated_timestamp")
+        connection.exec_driver_sql(
+            "CREATE INDEX ix_statuses_asset_id_last_updated_timestamp ON statuses (asset_id, last_updated_timestamp)"
+            )
+        connection.execute(Statuses.__table__.insert(), statuses_rows_list)
+        connection.exec_driver_sql("UPDATE daily_statuses SET samples_count = 2")
+        connection.exec_driver_sql("PRAGMA user_version = 2")
+
+    database_manager.migrate_database()
+    with Session(database_manager.engine) as session:
+        assert session.scalars(select(Statuses.id)).all() == [1]
+        assert session.scalars(select(DailyStatuses.samples_count)).all() == [1]
+    with Session(database_manager.engine) as session, session.begin():
+        assert database_manager.insert_statuses(session, statuses_rows_list) == 0
@@ -0,0 +1,99 @@
+"""
+Purpose: Tests for the fetch manager of The Daily BTC Web Application, against a local stub upstream.
+"""
+
+import time
+import pytest
+import requests
+from fetchmanager import FetchManager
+
+@pytest.fixture
+def fetch_manager():
+    fetch_manager = FetchManager()
+    fetch_manager.read_timeout_sec = 1
+    fetch_manager.backoff_base_sec = 0.01
+    fetch_manager.backoff_max_sec = 0.05
+    yield fetch_manager
+    fetch_manager.fetch_executor.shutdown()
+
+def test_fetch_retries_retryable_statuses(stub_upstream, fetch_manager):
+    stub_upstream.routes["/flaky"] = lambda call_number, headers: (503 if call_number <= 2 else 200, {}, b"{}")
+    response = fetch_manager.fetch("flaky", f"{stub_upstream.url}/flaky")
+    assert response.status_code == 200
+    assert stub_upstream.calls["/flaky"] == 3
+    fetch_stats = fetch_manager.get_fetch_stats()["flaky"]
+    assert (fetch_stats["requests"], fetch_stats["failures"], fetch_stats["retries"]) == (3, 2, 2)
+
+def test_fetch_gives_up_after_max_retries(stub_upstream, fetch_manager):
+    fetch_manager.max_retries = 2
+    stub_upstream.routes["/down"] = lambda call_number, headers: (503, {}, b"")
+    with pytest.raises(requests.HTTPError) as exception_info:
+        fetch_manager.fetch("down", f"{stub_upstream.url}/down")
+    assert exception_info.value.response.status_code == 503
+    assert stub_upstream.calls["/down"] == 3 # The First Attempt Plus max_retries
+
+def test_fetch_retries_read_timeouts(stub_upstream, fetch_manager):
+    def respond_slowly_once(call_number, headers):
+        time.sleep(2 if call_number == 1 else 0) # First Call Exceeds The Read Timeout
+        return 200, {}, b"{}"
+    stub_upstream.routes["/slow"] = respond_slowly_once
+    start_time = time.perf_counter()
+    response = fetch_manager.fetch("slow", f"{stub_upstream.url}/slow")
+    assert response.status_code == 200
+    assert stub_upstream.calls["/slow"] == 2
+    assert time.perf_counter() - start_time < 2 # Timed Out Instead Of Waiting On The Slow Call
+    assert fetch_manager.get_fetch_stats()["slow"]["retries"] == 1
+
+def test_fetch_retries_connection_errors(fetch_manager):
+    fetch_manager.max_retries = 1
+    with pytest.raises(requests.ConnectionError):
+        fetch_manager.fetch("closed", "http://127.0.0.1:9/") # Discard Port, Nothing Listening
+    assert fetch_manager.get_fetch_stats()["closed"]["requests"] == 2
+
+def test_fetch_does_not_retry_client_errors(stub_upstream, fetch_manager):
+    stub_upstream.routes["/missing"] = lambda call_number, headers: (404, {}, b"")
+    with pytest.raises(requests.HTTPError):
+        fetch_manager.fetch("missing", f"{stub_upstream.url}/missing")
+    assert stub_upstream.calls["/missing"] == 1
+
+def test_fetch_leaves_retry_after_to_the_schedule_manager(stub_upstream, fetch_manager):
+    stub_upstream.routes["/limited"] = lambda call_number, headers: (429, {"Retry-After": "120"}, b"")
+    with pytest.raises(requests.HTTPError) as exception_info:
+        fetch_manager.fetch("limited", f"{stub_upstream.url}/limited")
+    assert exception_info.value.response.headers["Retry-After"] == "120"
+    assert stub_upstream.calls["/limited"] == 1 # Not Retried Within The Upstream's Own Wait
+
+def test_fetch_passes_params_and_headers(stub_upstream, fetch_manager):
+    stub_upstream.routes["/echo"] = lambda call_number, headers: (200, {}, b"{}")
+    fetch_manager.fetch("echo", f"{stub_upstream.url}/echo", params={"q": "bitcoin"}, headers={"If-None-Match": '"v1"'})
+    assert stub_upstream.requests_headers["/echo"][0]["If-None-Match"] == '"v1"'
+
+def test_fetch_all_fetches_concurrently_and_returns_errors(stub_upstream, fetch_manager):
+    def respond_slowly(call_number, headers):
+        time.sleep(0.5)
+        return 200, {}, b"{}"
+    stub_upstream.routes["/coingecko"] = respond_slowly
+    stub_upstream.routes["/news"] = respond_slowly
+    stub_upstream.routes["/down"] = lambda call_number, headers: (404, {}, b"")
+    start_time = time.perf_counter()
+    fetch_results = fetch_manager.fetch_all(
+        {source_name: {"url": f"{stub_upstream.url}/{source_name}"} for source_name in ["coingecko", "news", "down"]}
+        )
+    assert time.perf_counter() - start_time < 0.9 # Both Slow Sources Waited On Together
+    assert fetch_results["coingecko"].status_code == 200
+    assert fetch_results["news"].status_code == 200
+    assert isinstance(fetch_results["down"], requests.HTTPError)
+
+def test_fetch_all_shares_the_rate_limit_across_requests(stub_upstream, fetch_manager):
+    fetch_manager.sources_rates_per_min["limited"] = 600 # One Request Start Every 0.1s
+    stub_upstream.routes["/limited"] = lambda call_number, headers: (200, {}, b"{}")
+    start_time = time.perf_counter()
+    fetch_results = fetch_manager.fetch_all(
+        {
+            ("limited", asset_id): {"source_name": "limited", "url": f"{stub_upstream.url}/limited"}
+            for asset_id in ["bitcoin", "ethereum", "solana", "cardano", "dogecoin", "litecoin"]
+            }
+        )
+    assert time.perf_counter() - start_time >= 0.5 # Six Starts Spaced 0.1s Apart, Despite Four Threads
+    assert all(fetch_result.status_code == 200 for fetch_result in fetch_results.values())
+    assert stub_upstream.calls["/limited"] == 6
@@ -0,0 +1,58 @@
+"""
+Purpose: Leader election tests for the leader manager of The Daily BTC Web Application.
+"""
+
+import os
+import time
+import queue
+import multiprocessing
+from leadermanager import LeaderManager
+
+CANDIDATES_COUNT = 4
+CAMPAIGN_RATE_SEC = 0.1
+ELECTION_TIMEOUT_SEC = 60
+RUNNER_UP_WAIT_SEC = 2
+
+def campaign(lock_path, candidate_id, leaders_queue):
+    # Campaigns Like The App's Scheduler, Only Faster, And Holds The Lock Until Killed
+    os.environ["LEADER_LOCK_PATH"] = lock_path
+    leader_manager = LeaderManager()
+    leader_manager.campaign_rate_sec = CAMPAIGN_RATE_SEC
+    while not leader_manager.try_acquire():
+        time.sleep(leader_manager.campaign_rate_sec)
+    leaders_queue.put(candidate_id)
+    while True:
+        time.sleep(leader_manager.campaign_rate_sec)
+
+def assert_no_other_leader(leaders_queue):
+    try:
+        other_leader_id = leaders_queue.get(timeout=RUNNER_UP_WAIT_SEC)
+    except queue.Empty:
+        return None
+    raise AssertionError(f"Candidate {other_leader_id} Also Became Leader")
+
+def test_one_leader_and_failover(tmp_path):
+    lock_path = str(tmp_path / "leader.lock")
+    spawn_context = multiprocessing.get_context("spawn")
+    leaders_queue = spawn_context.Queue()
+    candidates_list = [
+        spawn_context.Process(target=campaign, args=(lock_path, candidate_id, leaders_queue), daemon=True)
+        for candidate_id in range(CANDIDATES_COUNT)
+        ]
+    for candidate in candidates_list:
+        candidate.start()
+    try:
+        # Exactly One Candidate Wins
+        leader_id = leaders_queue.get(timeout=ELECTION_TIMEOUT_SEC)
+        assert_no_other_leader(leaders_queue)
+
+        # Killing The Leader Releases Its Lock, And Exactly One Follower Takes Over
+        candidates_list[leader_id].kill()
+        candidates_list[leader_id].join()
+        next_leader_id = leaders_queue.get(timeout=ELECTION_TIMEOUT_SEC)
+        assert next_leader_id != leader_id
+        assert_no_other_leader(leaders_queue)
+    finally:
+        for candidate in candidates_list:
+            candidate.kill()
+            candidate.join()
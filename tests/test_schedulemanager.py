@@ -0,0 +1,138 @@
+"""
+Purpose: Tests for the schedule manager of The Daily BTC Web Application, against a local stub upstream.
+"""
+
+import time
+import pytest
+import datetime as dt
+from email.utils import format_datetime
+from fetchmanager import FetchManager
+from schedulemanager import ScheduleManager
+
+@pytest.fixture
+def fetch_manager():
+    fetch_manager = FetchManager()
+    fetch_manager.max_retries = 0
+    fetch_manager.sources_rates_per_min = {} # Rate Limits Are Covered By The Fetch Manager Tests
+    yield fetch_manager
+    fetch_manager.fetch_executor.shutdown()
+
+@pytest.fixture
+def schedule_manager():
+    schedule_manager = ScheduleManager()
+    schedule_manager.sources_intervals["coingecko"] = {"min_sec": 60, "max_sec": 60 * 15}
+    schedule_manager.sources_states["coingecko"]["interval_sec"] = 60 * 5
+    return schedule_manager
+
+def poll(stub_upstream, fetch_manager, schedule_manager, path="/coins/bitcoin", request_key="bitcoin"):
+    # One Poll As The DataBase Manager Runs It: Conditional Request, Then Its Response Recorded
+    try:
+        response = fetch_manager.fetch(
+            "coingecko",
+            f"{stub_upstream.url}{path}",
+            headers=schedule_manager.get_conditional_headers("coingecko", request_key)
+            )
+    except Exception as exception:
+        response = getattr(exception, "response", None)
+    schedule_manager.record_response(
+        "coingecko",
+        {request_key: response},
+        int(response.status_code == 200) if response is not None and response.status_code < 400 else None
+        )
+    return response
+
+def respond_with_etag(etag):
+    def respond(call_number, headers):
+        if headers.get("If-None-Match") == etag:
+            return 304, {"ETag": etag}, b""
+        return 200, {"ETag": etag, "Last-Modified": "Mon, 01 Jan 2024 00:00:00 GMT"}, b"{}"
+    return respond
+
+def test_conditional_requests_revalidate_with_304(stub_upstream, fetch_manager, schedule_manager):
+    stub_upstream.routes["/coins/bitcoin"] = respond_with_etag('"v1"')
+    assert schedule_manager.get_conditional_headers("coingecko", "bitcoin") == {}
+    assert poll(stub_upstream, fetch_manager, schedule_manager).status_code == 200
+    assert schedule_manager.get_conditional_headers("coingecko", "bitcoin") == {
+        "If-None-Match": '"v1"',
+        "If-Modified-Since": "Mon, 01 Jan 2024 00:00:00 GMT"
+        }
+    assert poll(stub_upstream, fetch_manager, schedule_manager).status_code == 304
+    assert stub_upstream.requests_headers["/coins/bitcoin"][1]["If-None-Match"] == '"v1"'
+
+    # New Data Upstream: A Fresh ETag Replaces The Stored One
+    stub_upstream.routes["/coins/bitcoin"] = respond_with_etag('"v2"')
+    assert poll(stub_upstream, fetch_manager, schedule_manager).status_code == 200
+    assert schedule_manager.get_conditional_headers("coingecko", "bitcoin")["If-None-Match"] == '"v2"'
+
+def test_validators_are_kept_per_request(stub_upstream, fetch_manager, schedule_manager):
+    stub_upstream.routes["/coins/bitcoin"] = respond_with_etag('"btc"')
+    stub_upstream.routes["/coins/ethereum"] = respond_with_etag('"eth"')
+    poll(stub_upstream, fetch_manager, schedule_manager, "/coins/bitcoin", "bitcoin")
+    poll(stub_upstream, fetch_manager, schedule_manager, "/coins/ethereum", "ethereum")
+    assert schedule_manager.get_conditional_headers("coingecko", "bitcoin")["If-None-Match"] == '"btc"'
+    assert schedule_manager.get_conditional_headers("coingecko", "ethereum")["If-None-Match"] == '"eth"'
+
+def test_retry_after_seconds_delay_the_next_poll(stub_upstream, fetch_manager, schedule_manager):
+    stub_upstream.routes["/coins/bitcoin"] = lambda call_number, headers: (429, {"Retry-After": "5400"}, b"")
+    poll(stub_upstream, fetch_manager, schedule_manager)
+    assert schedule_manager.sources_states["coingecko"]["not_before"] >= time.monotonic() + 5400 - 5
+    assert 5400 - 5 <= schedule_manager.get_next_delay_sec("coingecko") <= 5400
+    assert schedule_manager.sources_states["coingecko"]["interval_sec"] == 60 * 5 # Failed Polls Keep The Cadence
+
+def test_retry_after_http_date_delays_the_next_poll(stub_upstream, fetch_manager, schedule_manager):
+    retry_at = format_datetime(dt.datetime.now(dt.timezone.utc) + dt.timedelta(hours=2), usegmt=True)
+    stub_upstream.routes["/coins/bitcoin"] = lambda call_number, headers: (503, {"Retry-After": retry_at}, b"")
+    poll(stub_upstream, fetch_manager, schedule_manager)
+    assert 7200 - 5 <= schedule_manager.get_next_delay_sec("coingecko") <= 7200
+
+def test_interval_halves_and_doubles_within_bounds(stub_upstream, fetch_manager, schedule_manager):
+    stub_upstream.routes["/coins/bitcoin"] = lambda call_number, headers: (200, {}, b"{}")
+    intervals_list = []
+    for _ in range(3): # New Rows Each Poll
+        poll(stub_upstream, fetch_manager, schedule_manager)
+        intervals_list.append(schedule_manager.sources_states["coingecko"]["interval_sec"])
+    assert intervals_list == [150, 75, 60] # Halved, Then Held At min_sec
+
+    stub_upstream.routes["/coins/bitcoin"] = lambda call_number, headers: (304, {}, b"")
+    intervals_list = []
+    for _ in range(6): # Nothing New Each Poll
+        poll(stub_upstream, fetch_manager, schedule_manager)
+        intervals_list.append(schedule_manager.sources_states["coingecko"]["interval_sec"])
+    assert intervals_list == [120, 240, 480, 900, 900, 900] # Doubled, Then Held At max_sec
+    assert schedule_manager.get_next_delay_sec("coingecko") == 900
+
+def test_remaining_quota_is_spread_until_reset(stub_upstream, fetch_manager, schedule_manager):
+    stub_upstream.routes["/coins/bitcoin"] = lambda call_number, headers: (
+        200,
+        {"X-RateLimit-Remaining": "2", "X-RateLimit-Reset": "3600"},
+        b"{}"
+        )
+    poll(stub_upstream, fetch_manager, schedule_manager)
+    assert schedule_manager.sources_states["coingecko"]["remaining"] == 2
+    assert schedule_manager.get_next_delay_sec("coingecko") == 1800 # 3600s Over 2 Requests, Above The Cadence
+
+    stub_upstream.routes["/coins/bitcoin"] = lambda call_number, headers: (
+        200,
+        {"X-RateLimit-Remaining": "0", "X-RateLimit-Reset": "3600"},
+        b"{}"
+        )
+    poll(stub_upstream, fetch_manager, schedule_manager)
+    assert schedule_manager.get_next_delay_sec("coingecko") == 3600 # Exhausted: Wait For The Reset
+
+def test_lowest_remaining_quota_wins_across_requests(schedule_manager):
+    class Response:
+        def __init__(self, remaining):
+            self.status_code = 200
+            self.headers = {"X-RateLimit-Remaining": str(remaining), "X-RateLimit-Reset": "600"}
+    schedule_manager.record_response("coingecko", {"bitcoin": Response(5), "ethereum": Response(3), "solana": None}, 1)
+    assert schedule_manager.sources_states["coingecko"]["remaining"] == 3
+
+def test_minimum_interval_scales_with_requests_per_poll():
+    single_schedule_manager = ScheduleManager()
+    schedule_manager = ScheduleManager({"coingecko": 10}) # Ten Assets, One Request Each
+    single_intervals = single_schedule_manager.sources_intervals["coingecko"]
+    intervals = schedule_manager.sources_intervals["coingecko"]
+    assert intervals["min_sec"] == 10 * single_intervals["min_sec"]
+    assert intervals["max_sec"] >= intervals["min_sec"]
+    assert schedule_manager.sources_states["coingecko"]["interval_sec"] >= intervals["min_sec"]
+    assert schedule_manager.sources_intervals["news"] == single_schedule_manager.sources_intervals["news"]